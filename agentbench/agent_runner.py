@@ -17,6 +17,7 @@ from agentbench.schemas.attempt_record import (
     AttemptRecord,
     BaselineValidationResult,
     LimitsConfig,
+    ModelConfig,
     TaskResult,
     TimestampInfo,
 )
@@ -223,7 +224,10 @@ def run_agent_attempt(
                 event_logger=event_logger,
                 budget=budget,
             )
-            result = loop.run()
+            try:
+                result = loop.run()
+            finally:
+                agent.close()
 
         exit_code = result.final_test_exit_code if result else -1
 
@@ -287,7 +291,14 @@ def run_agent_attempt(
             "patch_files": ",".join(result.patches_applied) if result else ""
         },
         variant = entrypoint,
-        model = None,
+        model = ModelConfig(
+            provider = str(llm_config.provider_config.provider),
+            name = llm_config.provider_config.model_name,
+            temperature = llm_config.sampling.temperature,
+            top_p = llm_config.sampling.top_p,
+            max_tokens = llm_config.sampling.max_tokens,
+            prompt_version = llm_config.prompt_version,
+        ) if llm_config else None,
         limits = LimitsConfig(
             timeout_sec = task.environment.timeout_sec,
             tool_timeout_sec = None
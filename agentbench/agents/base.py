@@ -55,3 +55,7 @@ class Agent(ABC):
             Formatted observation string
         """
         pass
+
+    def close(self) -> None:
+        """Release resources held across decide() calls. No-op by default."""
+        return None
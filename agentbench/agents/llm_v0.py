@@ -24,7 +24,7 @@ from agentbench.llm.messages import (
     MessageRole,
     ToolDefinition,
 )
-from agentbench.tools.contract import ToolName, ToolRequest
+from agentbench.tools.contract import ToolName, ToolRequest, ToolResult
 from agentbench.util.events import EventLogger, NullEventLogger, NULL_EVENT_LOGGER
 
 
@@ -44,6 +44,8 @@ class LLMAgentV0(Agent):
         self.event_logger = event_logger or NULL_EVENT_LOGGER
         self._request_counter = 0
         self._pending_tool_requests: list[ToolRequest] = []
+        self._runner: asyncio.Runner | None = None
+        self._history_render_cache: dict[int, tuple[ToolRequest, ToolResult, str]] = {}
 
     @property
     def variant_name(self) -> str:
@@ -129,40 +131,10 @@ class LLMAgentV0(Agent):
         if state.tool_history:
             lines.append("\n--- Previous Actions ---")
             # Show recent tool calls (limit to last 10 to avoid context overflow)
-            recent_history = state.tool_history[-10:]
-            for request, result in recent_history:
-                lines.append(f"\n[{request.tool.value}] {json.dumps(request.params)}")
-                if result.data:
-                    # Format the result data nicely
-                    if "output" in result.data:
-                        lines.append(f"Result: {result.data['output'][:2000]}")
-                    elif "files" in result.data:
-                        files = result.data["files"]
-                        lines.append(f"Files: {files}")
-                        if (
-                            isinstance(files, list)
-                            and "src" in files
-                            and "tests" in files
-                        ):
-                            lines.append(
-                                "Hint: repo uses src/ and tests/. Read the failing test, then the src module."
-                            )
-                    elif "matches" in result.data:
-                        matches = result.data["matches"]
-                        if isinstance(matches, list):
-                            lines.append(f"Matches ({len(matches)} results):")
-                            for match in matches[:5]:  # Limit matches shown
-                                lines.append(f"  {match}")
-                        else:
-                            lines.append(f"Matches: {str(matches)[:1000]}")
-                    elif "combined_output" in result.data:
-                        lines.append(f"Output:\n{result.data['combined_output'][:2000]}")
-                    elif "content" in result.data:
-                        lines.append(f"Content:\n{result.data['content'][:3000]}")
-                    else:
-                        lines.append(f"Result: {str(result.data)[:1000]}")
-                elif result.error:
-                    lines.append(f"Error: {result.error.message}")
+            history = state.tool_history
+            for index in range(max(0, len(history) - 10), len(history)):
+                request, result = history[index]
+                lines.append(self._render_history_entry(index, request, result))
 
         if state.patches_applied:
             lines.append("\nPatches applied:")
@@ -170,6 +142,51 @@ class LLMAgentV0(Agent):
 
         return "\n".join(lines).strip()
 
+    def _render_history_entry(
+        self, index: int, request: ToolRequest, result: ToolResult
+    ) -> str:
+        # History is append-only, so an entry renders identically on every
+        # later step; reuse the text while the same objects sit at the index.
+        cached = self._history_render_cache.get(index)
+        if cached is not None and cached[0] is request and cached[1] is result:
+            return cached[2]
+
+        lines = [f"\n[{request.tool.value}] {json.dumps(request.params)}"]
+        if result.data:
+            # Format the result data nicely
+            if "output" in result.data:
+                lines.append(f"Result: {result.data['output'][:2000]}")
+            elif "files" in result.data:
+                files = result.data["files"]
+                lines.append(f"Files: {files}")
+                if (
+                    isinstance(files, list)
+                    and "src" in files
+                    and "tests" in files
+                ):
+                    lines.append(
+                        "Hint: repo uses src/ and tests/. Read the failing test, then the src module."
+                    )
+            elif "matches" in result.data:
+                matches = result.data["matches"]
+                if isinstance(matches, list):
+                    lines.append(f"Matches ({len(matches)} results):")
+                    for match in matches[:5]:  # Limit matches shown
+                        lines.append(f"  {match}")
+                else:
+                    lines.append(f"Matches: {str(matches)[:1000]}")
+            elif "combined_output" in result.data:
+                lines.append(f"Output:\n{result.data['combined_output'][:2000]}")
+            elif "content" in result.data:
+                lines.append(f"Content:\n{result.data['content'][:3000]}")
+            else:
+                lines.append(f"Result: {str(result.data)[:1000]}")
+        elif result.error:
+            lines.append(f"Error: {result.error.message}")
+        text = "\n".join(lines)
+        self._history_render_cache[index] = (request, result, text)
+        return text
+
     def _build_messages(self, observation: str) -> list[InputItem]:
         system = InputMessage(
             role=MessageRole.SYSTEM,
@@ -401,10 +418,20 @@ class LLMAgentV0(Agent):
                 event_logger=self.event_logger,
             )
 
-        # Always use asyncio.run() to get a fresh event loop for each call.
-        # This avoids issues with closed/stale loops since we create a fresh
-        # httpx client for each request anyway.
-        return asyncio.run(_call())
+        # Keep one event loop for the whole run so the client's pooled
+        # connections survive between steps.
+        if self._runner is None:
+            self._runner = asyncio.Runner()
+        return self._runner.run(_call())
+
+    def close(self) -> None:
+        if self._runner is None:
+            return
+        try:
+            self._runner.run(self.client.aclose())
+        finally:
+            self._runner.close()
+            self._runner = None
 
     def _next_request_id(self, state: AgentState) -> str:
         self._request_counter += 1
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import hashlib
 import logging
 import re
+from collections import deque
 from datetime import datetime, timezone
 from contextlib import contextmanager
 import signal
+import threading
 from pathlib import Path
 
 import ulid
@@ -23,6 +26,7 @@ from agentbench.agents.types import (
 from agentbench.sandbox.docker_sandbox import DockerSandbox
 from agentbench.tasks.models import TaskSpec
 from agentbench.tools.builtins import list_files, read_file, run_tool, search
+from agentbench.tools.cache import ToolResultCache
 from agentbench.tools.contract import (
     ApplyPatchParams,
     ListFilesParams,
@@ -42,9 +46,33 @@ from agentbench.util.paths import ensure_dir
 from agentbench.util.truncation import truncate_output
 
 
+def _elapsed_sec(since: datetime) -> float:
+    return (datetime.now(timezone.utc) - since).total_seconds()
+
+
+def _digest_output(output: str) -> str:
+    return hashlib.blake2b(
+        output.encode("utf-8", errors="replace"), digest_size=8
+    ).hexdigest()
+
+
+# Only the main thread receives SIGINT. When loops run in worker threads
+# (run-agent-suite --concurrency), the main thread sets this event on Ctrl+C
+# and each loop stops at its next step.
+interrupt_event = threading.Event()
+
+
 @contextmanager
 def interruptible():
-    """Catch SIGINT (Ctrl+C) and convert to InterruptedError, restoring handler after."""
+    """Catch SIGINT (Ctrl+C) and convert to InterruptedError, restoring handler after.
+
+    Off the main thread signal handlers cannot be installed, so this is a
+    no-op there and interrupt_event is the only stop signal.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
     original = signal.getsignal(signal.SIGINT)
 
     def _handler(signum, frame):  # pragma: no cover - signal handler
@@ -57,6 +85,11 @@ def interruptible():
         signal.signal(signal.SIGINT, original)
 
 
+def _raise_if_interrupted() -> None:
+    if interrupt_event.is_set():
+        raise InterruptedError("Run interrupted by user (SIGINT)")
+
+
 class AgentLoop:
     """Executes an agent's decision loop with budget enforcement."""
 
@@ -84,8 +117,15 @@ class AgentLoop:
         self.budget = budget or AgentBudget()
         self._tool_step_counter = 0
         self._setup_completed = False
+        self._tool_cache = ToolResultCache()
         self._tests_ran_since_last_patch = False
         self._last_state: AgentState | None = None
+        # Digests of the most recent RUN outputs, fed incrementally from
+        # state.tool_history so repeated-failure checks never rescan the run.
+        self._recent_run_digests: deque[str] = deque(
+            maxlen=self.budget.repeated_failure_threshold
+        )
+        self._history_scanned = 0
 
     def run(self) -> AgentResult:
         started_at = datetime.now(timezone.utc)
@@ -94,7 +134,7 @@ class AgentLoop:
                 return self._run_main(started_at)
         except InterruptedError:
             state = self._last_state
-            duration = (datetime.now(timezone.utc) - started_at).total_seconds()
+            duration = _elapsed_sec(started_at)
             return AgentResult(
                 success=False,
                 stop_reason=StopReason.INTERRUPTED,
@@ -106,10 +146,11 @@ class AgentLoop:
             )
 
     def _run_main(self, started_at: datetime) -> AgentResult:
+        _raise_if_interrupted()
         exit_code, output = self._run_initial_tests()
         self._tests_ran_since_last_patch = True
         if exit_code == 0:
-            duration = (datetime.now(timezone.utc) - started_at).total_seconds()
+            duration = _elapsed_sec(started_at)
             return AgentResult(
                 success=True,
                 stop_reason=StopReason.SUCCESS,
@@ -136,6 +177,7 @@ class AgentLoop:
         self._last_state = state
 
         while True:
+            _raise_if_interrupted()
             logger.debug("Loop iteration: step=%d, budget_steps=%d", 
                          state.step_number, state.budget_remaining_steps)
             stop_reason = self._check_stop_conditions(state)
@@ -149,9 +191,7 @@ class AgentLoop:
                 ):
                     stop_reason = StopReason.SUCCESS
                 logger.info("Loop exiting: stop_reason=%s", stop_reason)
-                duration = (
-                    datetime.now(timezone.utc) - state.started_at
-                ).total_seconds()
+                duration = _elapsed_sec(state.started_at)
                 final_exit = state.last_test_exit_code
                 final_passed = final_exit == 0 if final_exit is not None else False
                 return AgentResult(
@@ -169,9 +209,7 @@ class AgentLoop:
                 action = self.agent.decide(state)
             except Exception as e:
                 logger.error("agent.decide() raised exception: %s", e, exc_info=True)
-                duration = (
-                    datetime.now(timezone.utc) - state.started_at
-                ).total_seconds()
+                duration = _elapsed_sec(state.started_at)
                 return AgentResult(
                     success=False,
                     stop_reason=StopReason.LLM_ERROR,
@@ -193,9 +231,7 @@ class AgentLoop:
                 ):
                     reason = StopReason.SUCCESS
                 logger.info("Agent decided to STOP: reason=%s", reason)
-                duration = (
-                    datetime.now(timezone.utc) - state.started_at
-                ).total_seconds()
+                duration = _elapsed_sec(state.started_at)
                 final_exit = state.last_test_exit_code
                 final_passed = final_exit == 0 if final_exit is not None else False
                 return AgentResult(
@@ -210,9 +246,7 @@ class AgentLoop:
 
             if action.tool_request is None:
                 logger.error("CALL_TOOL but tool_request is None")
-                duration = (
-                    datetime.now(timezone.utc) - state.started_at
-                ).total_seconds()
+                duration = _elapsed_sec(state.started_at)
                 return AgentResult(
                     success=False,
                     stop_reason=StopReason.TOOL_ERROR,
@@ -238,9 +272,7 @@ class AgentLoop:
                 # Only tolerate RUN errors that look like expected test failures.
                 is_non_run = action.tool_request.tool != ToolName.RUN
                 if is_non_run or not is_expected_test_failure:
-                    duration = (
-                        datetime.now(timezone.utc) - state.started_at
-                    ).total_seconds()
+                    duration = _elapsed_sec(state.started_at)
                     return AgentResult(
                         success=False,
                         stop_reason=StopReason.TOOL_ERROR,
@@ -275,9 +307,7 @@ class AgentLoop:
                 if is_test:
                     self._tests_ran_since_last_patch = True
                 if is_test and auto_result.exit_code == 0:
-                    duration = (
-                        datetime.now(timezone.utc) - state.started_at
-                    ).total_seconds()
+                    duration = _elapsed_sec(state.started_at)
                     return AgentResult(
                         success=True,
                         stop_reason=StopReason.SUCCESS,
@@ -294,9 +324,7 @@ class AgentLoop:
                 if is_test:
                     self._tests_ran_since_last_patch = True
                 if is_test and result.exit_code == 0:
-                    duration = (
-                        datetime.now(timezone.utc) - state.started_at
-                    ).total_seconds()
+                    duration = _elapsed_sec(state.started_at)
                     return AgentResult(
                         success=True,
                         stop_reason=StopReason.SUCCESS,
@@ -374,6 +402,11 @@ class AgentLoop:
         step_id = self._tool_step_counter
         started_at = datetime.now(timezone.utc)
 
+        cached = self._tool_cache.get(request)
+        if cached is not None:
+            self.event_logger.log_tool_finished(cached)
+            return cached
+
         try:
             if request.tool == ToolName.LIST_FILES:
                 params = ListFilesParams(**request.params)
@@ -531,6 +564,7 @@ class AgentLoop:
                 ),
             )
 
+        self._tool_cache.put(request, result)
         self.event_logger.log_tool_finished(result)
         return result
 
@@ -542,21 +576,24 @@ class AgentLoop:
         if state.budget_remaining_sec <= 0:
             return StopReason.MAX_TIME
 
-        threshold = self.budget.repeated_failure_threshold
-        outputs = []
-        for request, result in state.tool_history:
+        history = state.tool_history
+        if len(history) < self._history_scanned:
+            # A different (shorter) history than the one we have consumed.
+            self._recent_run_digests.clear()
+            self._history_scanned = 0
+        for request, result in history[self._history_scanned:]:
             if request.tool != ToolName.RUN:
                 continue
             if not result.data:
                 continue
             output = result.data.get("combined_output")
             if output is not None:
-                outputs.append(output)
+                self._recent_run_digests.append(_digest_output(output))
+        self._history_scanned = len(history)
 
-        if len(outputs) >= threshold:
-            tail = outputs[-threshold:]
-            if tail and all(out == tail[0] for out in tail):
-                return StopReason.REPEATED_FAILURE
+        digests = self._recent_run_digests
+        if len(digests) == digests.maxlen and len(set(digests)) == 1:
+            return StopReason.REPEATED_FAILURE
 
         return None
 
@@ -568,7 +605,7 @@ class AgentLoop:
     ) -> AgentState:
         step_number = state.step_number + 1
         budget_remaining_steps = max(0, state.budget_remaining_steps - 1)
-        elapsed = (datetime.now(timezone.utc) - state.started_at).total_seconds()
+        elapsed = _elapsed_sec(state.started_at)
         budget_remaining_sec = max(0.0, self.budget.max_time_sec - elapsed)
 
         tool_history = list(state.tool_history)
@@ -600,7 +637,9 @@ class AgentLoop:
                         result.data["combined_output"] = output
                 last_test_output = output
 
-        return AgentState(
+        # Every field comes from an already-validated state or tool result, so
+        # skip re-validating the whole tool history on each step.
+        return AgentState.model_construct(
             run_id=state.run_id,
             task_id=state.task_id,
             step_number=step_number,
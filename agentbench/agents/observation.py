@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from dataclasses import dataclass, field
 import re
 
@@ -5,7 +6,7 @@ from agentbench.agents.types import AgentState
 from agentbench.tools.contract import ToolName, ToolRequest, ToolResult, ToolStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class TestFailureSummary:
     __test__ = False
     exit_code: int
@@ -15,7 +16,7 @@ class TestFailureSummary:
     suggested_files: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ObservationContext:
     __test__ = False
     task_description: str
@@ -27,12 +28,16 @@ class ObservationContext:
     attempt_history: str = ""
 
 
+# pytest ("FAILED nodeid - msg") and unittest ("FAIL: test (Class)") failure
+# lines in a single pass; the named group that matched carries the test id.
 _FAILED_TEST_PATTERN = re.compile(
-    r"^(FAILED|ERROR)\s+(.+?)(?:\s+-\s+.*)?$"
+    r"^(?:(?:FAILED|ERROR)\s+(?P<pytest>.+?)(?:\s+-\s+.*)?"
+    r"|(?:FAIL|ERROR):\s+(?P<unittest>.+))$"
 )
-_UNITTEST_FAIL_PATTERN = re.compile(r"^(FAIL|ERROR):\s+(.+)$")
 _TRACEBACK_FILE_PATTERN = re.compile(r'File "([^"]+\.py)"')
-_PATH_PATTERN = re.compile(r"([A-Za-z0-9_./-]+\.py)")
+# Runs of path characters. `[A-Za-z0-9_./-]+\.py` backtracks quadratically on
+# long tokens without ".py", so paths are cut from each run instead.
+_PATH_RUN_PATTERN = re.compile(r"[A-Za-z0-9_./-]+")
 _PYTEST_SUMMARY_PATTERN = re.compile(r"(\d+)\s+failed")
 _UNITTEST_SUMMARY_PATTERN = re.compile(r"failures=(\d+)")
 _ERROR_KEYWORDS = (
@@ -46,45 +51,72 @@ _ERROR_KEYWORDS = (
     "ModuleNotFoundError",
     "NameError",
 )
+_ERROR_KEYWORD_PATTERN = re.compile("|".join(map(re.escape, _ERROR_KEYWORDS)))
+_TRUNCATION_MARKER = "\n... [truncated] ...\n"
+# Only the newest tool results are summarized, so the section costs O(1) per step.
+_RECENT_ACTIONS_LIMIT = 5
+# The tool list and instructions never change between steps; build them once.
+_STATIC_SECTIONS = "\n".join(
+    [
+        "## Available Tools",
+        "- list_files: List files in directory",
+        "- read_file: Read file contents",
+        "- search: Search for patterns",
+        "- apply_patch: Apply a unified diff patch",
+        "- run: Run a command",
+        "",
+        "## Instructions",
+        "Analyze the test failure and propose a fix. Use tools to investigate if needed, then apply a patch to fix the bug. After patching, run the tests to verify.",
+    ]
+)
+
+
+def _find_py_paths(line: str) -> list[str]:
+    """Same matches as findall on `[A-Za-z0-9_./-]+[.]py`, in linear time."""
+    paths = []
+    for run in _PATH_RUN_PATTERN.findall(line):
+        end = run.rfind(".py")
+        if end > 0:
+            paths.append(run[: end + 3])
+    return paths
 
 
 def parse_test_output(
-    output: str,
+    output: str | bytes,
     exit_code: int,
     test_framework: str = "pytest",
 ) -> TestFailureSummary:
     summary = TestFailureSummary(exit_code=exit_code)
     if not output:
         return summary
+    if isinstance(output, bytes):
+        # Raw subprocess output may not be valid UTF-8; decode once, lossily.
+        output = output.decode("utf-8", errors="replace")
 
     failed_tests = []
     error_snippets = []
     suggested_files = []
+    seen_files = set()
     lines = output.splitlines()
 
     for line in lines:
         stripped = line.strip()
         match = _FAILED_TEST_PATTERN.match(stripped)
         if match:
-            nodeid = match.group(2).strip()
-            failed_tests.append(nodeid)
-        else:
-            unit_match = _UNITTEST_FAIL_PATTERN.match(stripped)
-            if unit_match:
-                failed_tests.append(unit_match.group(2).strip())
+            failed_tests.append(match.group(match.lastgroup).strip())
 
         if stripped.startswith("E   "):
             error_snippets.append(stripped[4:])
-        else:
-            for keyword in _ERROR_KEYWORDS:
-                if keyword in stripped:
-                    error_snippets.append(stripped)
-                    break
+        elif _ERROR_KEYWORD_PATTERN.search(stripped):
+            error_snippets.append(stripped)
 
-        for pattern in (_TRACEBACK_FILE_PATTERN, _PATH_PATTERN):
-            for path in pattern.findall(stripped):
-                if path not in suggested_files:
-                    suggested_files.append(path)
+        # Both path patterns require a ".py" suffix; skip the regexes otherwise.
+        if ".py" not in stripped:
+            continue
+        for path in (*_TRACEBACK_FILE_PATTERN.findall(stripped), *_find_py_paths(stripped)):
+            if path not in seen_files:
+                seen_files.add(path)
+                suggested_files.append(path)
 
     # remove duplicates while preserving order
     summary.failed_tests = list(dict.fromkeys(failed_tests))
@@ -128,11 +160,10 @@ def truncate_output(
     if len(content) <= max_chars and len(lines) <= max_lines:
         return content, False
 
+    marker = _TRUNCATION_MARKER
     truncated = content
     was_truncated = False
 
-    marker = "\n... [truncated] ...\n"
-
     if len(lines) > max_lines:
         head = lines[:keep_head]
         tail = lines[-keep_tail:] if keep_tail > 0 else []
@@ -141,15 +172,47 @@ def truncate_output(
 
     if len(truncated) > max_chars:
         if max_chars <= len(marker):
-            truncated = marker[:max_chars]
-        else:
-            keep = (max_chars - len(marker)) // 2
-            truncated = truncated[:keep] + marker + truncated[-keep:]
+            # No room for the marker; keep the head of the text instead.
+            return truncated[:max_chars], True
+        keep = (max_chars - len(marker)) // 2
+        truncated = truncated[:keep] + marker + truncated[len(truncated) - keep :]
         was_truncated = True
 
     return truncated, was_truncated
 
 
+def _summarize_list_files(tool: str, result: ToolResult, data: dict) -> str:
+    return f"{tool} → {len(data.get('files', []))} files found"
+
+
+def _summarize_read_file(tool: str, result: ToolResult, data: dict) -> str:
+    total_lines = data.get("total_lines")
+    return f"{tool} → {total_lines} lines" if total_lines else f"{tool} → read"
+
+
+def _summarize_search(tool: str, result: ToolResult, data: dict) -> str:
+    total = data.get("total_matches")
+    return f"{tool} → {total} matches" if total is not None else f"{tool} → searched"
+
+
+def _summarize_apply_patch(tool: str, result: ToolResult, data: dict) -> str:
+    changed = data.get("changed_files", [])
+    return f"{tool} → changed {changed}" if changed else f"{tool} → patched"
+
+
+def _summarize_run(tool: str, result: ToolResult, data: dict) -> str:
+    return f"{tool} → exit_code={result.exit_code}"
+
+
+_SUMMARY_HANDLERS: dict[ToolName, Callable[[str, ToolResult, dict], str]] = {
+    ToolName.LIST_FILES: _summarize_list_files,
+    ToolName.READ_FILE: _summarize_read_file,
+    ToolName.SEARCH: _summarize_search,
+    ToolName.APPLY_PATCH: _summarize_apply_patch,
+    ToolName.RUN: _summarize_run,
+}
+
+
 def format_tool_result_summary(result: ToolResult, max_data_chars: int = 500) -> str:
     tool = result.tool.value
     if result.status == ToolStatus.ERROR:
@@ -159,24 +222,8 @@ def format_tool_result_summary(result: ToolResult, max_data_chars: int = 500) ->
     if result.data is None:
         return f"{tool} → SUCCESS"
 
-    data = result.data
-    summary = ""
-    if result.tool == ToolName.LIST_FILES:
-        count = len(data.get("files", []))
-        summary = f"{tool} → {count} files found"
-    elif result.tool == ToolName.READ_FILE:
-        total_lines = data.get("total_lines")
-        summary = f"{tool} → {total_lines} lines" if total_lines else f"{tool} → read"
-    elif result.tool == ToolName.SEARCH:
-        total = data.get("total_matches")
-        summary = f"{tool} → {total} matches" if total is not None else f"{tool} → searched"
-    elif result.tool == ToolName.APPLY_PATCH:
-        changed = data.get("changed_files", [])
-        summary = f"{tool} → changed {changed}" if changed else f"{tool} → patched"
-    elif result.tool == ToolName.RUN:
-        summary = f"{tool} → exit_code={result.exit_code}"
-    else:
-        summary = f"{tool} → SUCCESS"
+    handler = _SUMMARY_HANDLERS.get(result.tool)
+    summary = handler(tool, result, result.data) if handler else f"{tool} → SUCCESS"
 
     if len(summary) > max_data_chars:
         summary = summary[: max_data_chars - 3] + "..."
@@ -202,9 +249,10 @@ def build_observation(
     max_steps = steps_taken + state.budget_remaining_steps
     time_remaining = state.budget_remaining_sec
 
-    recent_actions = []
-    for request, result in state.tool_history[-5:]:
-        recent_actions.append(format_tool_result_summary(result))
+    recent_actions = [
+        format_tool_result_summary(result)
+        for _, result in state.tool_history[-_RECENT_ACTIONS_LIMIT:]
+    ]
 
     file_context_blocks = []
     seen_paths = set()
@@ -266,19 +314,6 @@ def build_observation(
             ]
         )
 
-    sections.extend(
-        [
-            "",
-            "## Available Tools",
-            "- list_files: List files in directory",
-            "- read_file: Read file contents",
-            "- search: Search for patterns",
-            "- apply_patch: Apply a unified diff patch",
-            "- run: Run a command",
-            "",
-            "## Instructions",
-            "Analyze the test failure and propose a fix. Use tools to investigate if needed, then apply a patch to fix the bug. After patching, run the tests to verify.",
-        ]
-    )
+    sections.extend(["", _STATIC_SECTIONS])
 
     return "\n".join(sections).strip()
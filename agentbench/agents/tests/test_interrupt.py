@@ -1,7 +1,9 @@
+import threading
+
 import pytest
 
 from agentbench.agents.base import Agent
-from agentbench.agents.loop import AgentLoop
+from agentbench.agents.loop import AgentLoop, interrupt_event
 from agentbench.agents.types import AgentAction, AgentDecision, AgentState, StopReason
 from agentbench.tasks.models import (
     AgentSpec,
@@ -68,3 +70,25 @@ def test_agent_loop_interrupt(monkeypatch, tmp_path):
     assert result.stop_reason == StopReason.INTERRUPTED
     assert result.success is False
     assert result.steps_taken == 0
+
+
+def test_agent_loop_stops_on_interrupt_event_in_worker_thread(monkeypatch, tmp_path):
+    loop = AgentLoop(
+        agent=DummyAgent(),
+        task=_make_task(),
+        workspace_root=tmp_path,
+        artifacts_dir=tmp_path / "artifacts",
+        sandbox=None,  # not used: the loop stops before the initial tests
+        event_logger=NullEventLogger(),  # type: ignore[arg-type]
+        budget=None,
+    )
+    results = []
+    interrupt_event.set()
+    try:
+        worker = threading.Thread(target=lambda: results.append(loop.run()))
+        worker.start()
+        worker.join()
+    finally:
+        interrupt_event.clear()
+
+    assert results[0].stop_reason == StopReason.INTERRUPTED
@@ -12,6 +12,7 @@ class StubLLMClient:
     def __init__(self, response: LLMResponse):
         self.response = response
         self.calls = []
+        self.closed = False
 
     async def complete(self, input_items, tools=None, event_logger=None):
         self.calls.append({"input": input_items, "tools": tools})
@@ -20,6 +21,9 @@ class StubLLMClient:
     def count_tokens(self, input_items):
         return 0
 
+    async def aclose(self):
+        self.closed = True
+
 
 def make_agent(response: LLMResponse) -> LLMAgentV0:
     config = LLMConfig(
@@ -46,6 +50,35 @@ def make_state() -> AgentState:
     )
 
 
+def test_close_releases_client_and_event_loop():
+    response = LLMResponse.model_validate(
+        {
+            "id": "resp-1",
+            "model": "mistralai/devstral-2512:free",
+            "status": "completed",
+            "output": [
+                {
+                    "type": "function_call",
+                    "id": "fc-1",
+                    "call_id": "call-1",
+                    "name": "search",
+                    "arguments": json.dumps({"query": "def add"}),
+                }
+            ],
+        }
+    )
+    agent = make_agent(response)
+
+    agent.decide(make_state())
+    runner = agent._runner
+    agent.decide(make_state())
+
+    assert agent._runner is runner
+    agent.close()
+    assert agent.client.closed
+    assert agent._runner is None
+
+
 def test_decide_returns_tool_request_from_response():
     response = LLMResponse.model_validate(
         {
@@ -232,6 +265,54 @@ def test_format_observation_includes_budget_and_test_output():
     assert "FAILED tests/test_basic.py::test_add" in obs
 
 
+
+def _history_entry(request_id: str, output: str) -> tuple[ToolRequest, ToolResult]:
+    now = datetime.now(timezone.utc)
+    request = ToolRequest(
+        tool=ToolName.SEARCH, params={"query": "def add"}, request_id=request_id
+    )
+    result = ToolResult(
+        request_id=request_id,
+        tool=ToolName.SEARCH,
+        status=ToolStatus.SUCCESS,
+        started_at=now,
+        ended_at=now,
+        duration_sec=0.0,
+        data={"output": output},
+    )
+    return request, result
+
+
+def test_format_observation_reuses_rendered_history_entries():
+    agent = make_agent(LLMResponse.model_validate({"output": []}))
+    state = make_state()
+    state.tool_history = [_history_entry("req-1", "first output")]
+
+    first = agent.format_observation(state)
+    cached_text = agent._history_render_cache[0][2]
+    state.tool_history.append(_history_entry("req-2", "second output"))
+    second = agent.format_observation(state)
+
+    assert "--- Previous Actions ---" in first
+    assert "Result: first output" in first
+    assert cached_text in second
+    assert agent._history_render_cache[0][2] is cached_text
+    assert "Result: second output" in second
+
+
+def test_format_observation_rerenders_replaced_history_entry():
+    agent = make_agent(LLMResponse.model_validate({"output": []}))
+    state = make_state()
+    state.tool_history = [_history_entry("req-1", "old output")]
+    agent.format_observation(state)
+
+    state.tool_history = [_history_entry("req-1", "new output")]
+    obs = agent.format_observation(state)
+
+    assert "Result: new output" in obs
+    assert "old output" not in obs
+
+
 def test_build_messages_includes_system_and_user():
     response = LLMResponse.model_validate(
         {
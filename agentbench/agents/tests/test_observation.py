@@ -343,6 +343,14 @@ def test_parse_test_output_empty_returns_default_summary():
     assert summary.error_snippets == []
 
 
+def test_parse_test_output_accepts_invalid_utf8_bytes():
+    output = b"FAILED tests/test_math.py::test_add - AssertionError \xff\xfe\n1 failed"
+    summary = parse_test_output(output, exit_code=1)
+
+    assert summary.failed_tests == ["tests/test_math.py::test_add"]
+    assert "tests/test_math.py" in summary.suggested_files
+
+
 def test_parse_unittest_failure_pattern():
     """Test line 74: unittest-style failure parsing."""
     output = """
@@ -617,3 +625,25 @@ def test_format_tool_result_error_no_error_object():
     )
     summary = format_tool_result_summary(result)
     assert "ERROR (error)" in summary
+
+
+def test_truncate_output_keeps_content_head_when_marker_does_not_fit():
+    result, was_truncated = truncate_output("abcdefghijklmnop" * 10, max_chars=5)
+    assert was_truncated is True
+    assert result == "abcde"
+
+
+def test_truncate_output_just_above_marker_length_stays_within_budget():
+    content = "y" * 1000
+    result, was_truncated = truncate_output(content, max_chars=22)
+    assert was_truncated is True
+    assert len(result) <= 22
+
+
+def test_truncate_output_applies_line_limit_with_small_char_budget():
+    result, was_truncated = truncate_output(
+        "a\nb\nc\nd\ne", max_chars=15, max_lines=2, keep_head=1, keep_tail=1
+    )
+    assert was_truncated is True
+    # Lines b-d are dropped before the character budget cuts the marker short.
+    assert result == "a\n... [truncated] ...\ne"[:15]
@@ -164,3 +164,44 @@ def test_repeated_failure_detected(tmp_path: Path):
     )
 
     assert loop._check_stop_conditions(state) == StopReason.REPEATED_FAILURE
+
+
+def test_repeated_failure_tracks_history_incrementally(tmp_path: Path):
+    budget = AgentBudget(repeated_failure_threshold=2, max_steps=5)
+    loop = make_loop(tmp_path, budget=budget)
+
+    def run_entry(request_id: str, output: str):
+        now = datetime.now(timezone.utc)
+        return (
+            ToolRequest(tool=ToolName.RUN, params={}, request_id=request_id),
+            ToolResult(
+                request_id=request_id,
+                tool=ToolName.RUN,
+                status=ToolStatus.ERROR,
+                started_at=now,
+                ended_at=now,
+                duration_sec=0.01,
+                data={"combined_output": output},
+                exit_code=1,
+            ),
+        )
+
+    history = [run_entry("r1", "first failure"), run_entry("r2", "second failure")]
+    state = make_state(
+        step_number=2,
+        last_test_exit_code=1,
+        budget_remaining_steps=3,
+        budget_remaining_sec=100.0,
+        tool_history=history,
+    )
+    assert loop._check_stop_conditions(state) is None
+
+    history = history + [run_entry("r3", "second failure")]
+    state = make_state(
+        step_number=3,
+        last_test_exit_code=1,
+        budget_remaining_steps=2,
+        budget_remaining_sec=100.0,
+        tool_history=history,
+    )
+    assert loop._check_stop_conditions(state) == StopReason.REPEATED_FAILURE
@@ -1,39 +1,180 @@
+import asyncio
 import logging
 import os
 import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
-from pydantic import SecretStr
+from pydantic import ValidationError
 from rich.console import Console
 from rich.table import Table
 
-from agentbench.agent_runner import run_agent_attempt
-from agentbench.llm.config import LLMConfig, LLMProvider, ProviderConfig
-from agentbench.llm.openrouter import OpenRouterClient
 from agentbench.logging import setup_logging
 from agentbench.run_task import run_task
 from agentbench.reporting.cli import report_app
-from agentbench.schemas.attempt_record import AttemptRecord
+from agentbench.scoring import FailureReason
 from agentbench.suite_runner import run_suite
 from agentbench.tasks.exceptions import SuiteNotFoundError
 from agentbench.tasks.loader import load_suite, load_task
+from agentbench.tasks.models import TaskSpec
+
+if TYPE_CHECKING:
+    from agentbench.llm.config import LLMConfig
+    from agentbench.llm.openrouter import OpenRouterClient
+    from agentbench.schemas.attempt_record import AttemptRecord
 
 logger = logging.getLogger(__name__)
 
 app = typer.Typer(no_args_is_help=True)
-console = Console()
-
-setup_logging()
+# Output is status text and tables; automatic repr highlighting is pure overhead.
+console = Console(highlight=False)
 
 app.add_typer(report_app, name="report")
 
 
-def print_agent_summary(record: AttemptRecord) -> None:
-    """Print a pretty summary table for an agent run."""
+def _walk_rmtree(path: Path) -> None:
+    """Remove a tree bottom-up with os.walk (scandir-backed), unlinking as it goes."""
+    for root, dirs, files in os.walk(path, topdown=False):
+        for name in files:
+            os.unlink(os.path.join(root, name))
+        for name in dirs:
+            entry = os.path.join(root, name)
+            # os.walk lists symlinks to directories under dirs without following them.
+            if os.path.islink(entry):
+                os.unlink(entry)
+            else:
+                os.rmdir(entry)
+    os.rmdir(path)
+
+
+def _fast_rmtree(path: Path) -> None:
+    """Remove a workspace tree, preferring one `rm -rf` over a per-entry Python walk.
+
+    Cloned repositories can hold many thousands of files; a single native
+    process avoids shutil.rmtree's per-entry syscall overhead. Without `rm`
+    (non-POSIX, or it fails) the tree is removed with a bottom-up os.walk,
+    and shutil.rmtree sweeps up whatever that walk could not delete.
+    """
+    rm = shutil.which("rm") if os.name == "posix" else None
+    if rm is not None:
+        result = subprocess.run(
+            [rm, "-rf", "--", str(path)],
+            check=False,
+            capture_output=True,
+        )
+        if result.returncode == 0:
+            return
+        logger.debug("rm -rf failed for %s, falling back to os.walk", path)
+    try:
+        _walk_rmtree(path)
+    except OSError as e:
+        logger.debug("os.walk removal failed for %s (%s), falling back to shutil.rmtree", path, e)
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def _build_llm_client(
+    out_dir: Path, llm_cache: bool | None
+) -> tuple["LLMConfig", "OpenRouterClient"]:
+    """Build the OpenRouter config and client from the environment."""
+    # The LLM stack (httpx, sqlite3) is only needed by agent commands.
+    from pydantic import SecretStr
+
+    from agentbench.llm.cache import ResponseCache, llm_cache_enabled
+    from agentbench.llm.config import LLMConfig, LLMProvider, ProviderConfig
+    from agentbench.llm.errors import AuthenticationError
+    from agentbench.llm.openrouter import OpenRouterClient
+
+    api_key_str = os.getenv("OPENROUTER_API_KEY")
+    if not api_key_str:
+        console.print("[red]Error: OPENROUTER_API_KEY environment variable is required for llm_v0[/red]")
+        raise typer.Exit(code=1)
+
+    model_name = _llm_model_name()
+    llm_config = LLMConfig(
+        provider_config=ProviderConfig(
+            provider=LLMProvider.OPENROUTER,
+            model_name=model_name,
+            api_key=SecretStr(api_key_str),
+            timeout_sec=120,
+        )
+    )
+    llm_client = OpenRouterClient(config=llm_config)
+
+    # Reject a bad key before any workspace is cloned or container started.
+    try:
+        asyncio.run(llm_client.verify_auth())
+    except AuthenticationError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(code=1)
+
+    if llm_cache_enabled(llm_cache):
+        llm_client.response_cache = ResponseCache(out_dir / ".llm_cache" / "responses.sqlite3")
+    return llm_config, llm_client
+
+
+def _close_response_cache(llm_client: "OpenRouterClient | None") -> None:
+    if llm_client is not None and llm_client.response_cache is not None:
+        llm_client.response_cache.close()
+
+
+def _llm_model_name() -> str:
+    return os.getenv("MODEL_NAME", "anthropic/claude-3.5-sonnet")
+
+
+# Failures caused by the environment rather than the agent; attempts that
+# end this way are not checkpointed, so --resume retries them.
+_RETRY_ON_RESUME = frozenset(
+    {
+        FailureReason.INTERRUPTED,
+        FailureReason.UNKNOWN,
+        FailureReason.LLM_ERROR,
+        FailureReason.SANDBOX_ERROR,
+        FailureReason.GIT_CLONE_FAILED,
+        FailureReason.GIT_CHECKOUT_FAILED,
+    }
+)
+
+
+def _load_suite_checkpoint(
+    path: Path, variant: str, model_name: str | None
+) -> dict[str, "AttemptRecord"]:
+    """Return the latest checkpointed attempt per task id for this variant and model."""
+    from agentbench.schemas.attempt_record import AttemptRecord
+    from agentbench.util.jsonl import read_jsonl
+
+    completed: dict[str, AttemptRecord] = {}
+    if not path.exists():
+        return completed
+    for data in read_jsonl(path):
+        try:
+            record = AttemptRecord.model_validate(data)
+        except ValidationError as e:
+            logger.warning("Ignoring unreadable checkpoint entry in %s: %s", path, e)
+            continue
+        record_model = record.model.name if record.model else None
+        if record.variant != variant or record_model != model_name:
+            continue
+        if record.result.failure_reason in _RETRY_ON_RESUME:
+            continue
+        completed[record.task_id] = record
+    return completed
+
+
+_AGENT_SUMMARY_COLUMNS = (("Metric", "cyan"), ("Value", "green"))
+
+
+def print_agent_summary(record: "AttemptRecord", artifacts_dir: Path | None = None) -> None:
+    """Print a pretty summary table for an agent run.
+
+    When artifacts_dir is given, the artifacts line is emitted in the same
+    console write as the table.
+    """
     table = Table(title="Agent Run Summary")
-    table.add_column("Metric", style="cyan")
-    table.add_column("Value", style="green")
+    for header, style in _AGENT_SUMMARY_COLUMNS:
+        table.add_column(header, style=style)
     
     table.add_row("Run ID", record.run_id)
     table.add_row("Task ID", record.task_id)
@@ -42,12 +183,46 @@ def print_agent_summary(record: AttemptRecord) -> None:
     table.add_row("Duration", f"{record.duration_sec:.1f}s")
     table.add_row("Variant", record.variant or "baseline")
     if record.result.stop_reason:
-        table.add_row("Stop Reason", str(record.result.stop_reason))
+        table.add_row("Stop Reason", record.result.stop_reason.value)
     
     if record.result.failure_reason:
-        table.add_row("Failure Reason", str(record.result.failure_reason))
-    
-    console.print(table)
+        table.add_row("Failure Reason", record.result.failure_reason.value)
+
+    if artifacts_dir is None:
+        console.print(table)
+    else:
+        console.print(table, f"[dim]Artifacts saved to: {artifacts_dir}[/dim]\n", sep="\n")
+
+
+_SUITE_SUMMARY_COLUMNS = (
+    ("Task", "cyan"),
+    ("Success", "green"),
+    ("Exit", "magenta"),
+    ("Stop Reason", "yellow"),
+    ("Failure Reason", "red"),
+)
+# Above this many rows, Rich's per-cell measurement dominates; print plain text.
+_SUITE_SUMMARY_TABLE_MAX_ROWS = 100
+
+
+def print_suite_summary(suite: str, rows: list[tuple[str, ...]]) -> None:
+    """Print the per-task suite summary as a Rich table, or plain text for large suites."""
+    title = f"Suite Run Summary: {suite}"
+    if len(rows) <= _SUITE_SUMMARY_TABLE_MAX_ROWS:
+        summary = Table(title=title)
+        for header, style in _SUITE_SUMMARY_COLUMNS:
+            summary.add_column(header, style=style)
+        for row in rows:
+            summary.add_row(*row)
+        console.print(summary)
+        return
+
+    headers = tuple(header for header, _ in _SUITE_SUMMARY_COLUMNS)
+    widths = [max(map(len, column)) for column in zip(headers, *rows)]
+    lines = [title]
+    for row in (headers, *rows):
+        lines.append("  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip())
+    console.print("\n".join(lines), markup=False)
 
 
 @app.command("run-task")
@@ -112,6 +287,11 @@ def run_agent_cmd(
         "--log-llm-messages/--no-log-llm-messages",
         help="Write LLM request/response pairs to llm_messages.jsonl.",
     ),
+    llm_cache: bool | None = typer.Option(
+        None,
+        "--llm-cache/--no-llm-cache",
+        help="Serve identical LLM requests from <out>/.llm_cache (default: AGENTBENCH_LLM_CACHE).",
+    ),
     strict_patch: bool = typer.Option(
         False,
         "--strict-patch/--no-strict-patch",
@@ -129,17 +309,25 @@ def run_agent_cmd(
     This command loads a task, runs the specified agent variant,
     and produces an attempt record with all artifacts.
     """
+    # Deferred so task listing and validation skip importing the agent stack.
+    from agentbench.agent_runner import run_agent_attempt
+
+    llm_config = None
+    llm_client = None
     try:
         logger.info("Loading task from %s", task_path)
         task = load_task(task_path)
-        
+
+        if variant == "llm_v0":
+            llm_config, llm_client = _build_llm_client(out_dir, llm_cache)
+
         workspace_dir = out_dir / "workspace" / task.id
         artifacts_dir = out_dir / "agent_runs" / task.id
         
         # Auto-clean workspace from previous runs to avoid git clone conflicts
         if workspace_dir.exists():
             logger.debug("Cleaning up existing workspace at %s", workspace_dir)
-            shutil.rmtree(workspace_dir, ignore_errors=True)
+            _fast_rmtree(workspace_dir)
         
         workspace_dir.mkdir(parents=True, exist_ok=True)
         artifacts_dir.mkdir(parents=True, exist_ok=True)
@@ -150,27 +338,6 @@ def run_agent_cmd(
             os.environ["AGENTBENCH_STRICT_PATCH"] = "1"
         else:
             os.environ.pop("AGENTBENCH_STRICT_PATCH", None)
-        
-        llm_config = None
-        llm_client = None
-
-        if variant == "llm_v0":
-            api_key_str = os.getenv("OPENROUTER_API_KEY")
-            if not api_key_str:
-                console.print("[red]Error: OPENROUTER_API_KEY environment variable is required for llm_v0[/red]")
-                raise typer.Exit(code=1)
-            
-            model_name = os.getenv("MODEL_NAME", "anthropic/claude-3.5-sonnet")
-            
-            llm_config = LLMConfig(
-                provider_config=ProviderConfig(
-                    provider=LLMProvider.OPENROUTER,
-                    model_name=model_name,
-                    api_key=SecretStr(api_key_str),
-                    timeout_sec=120
-                )
-            )
-            llm_client = OpenRouterClient(config=llm_config)
 
         record = run_agent_attempt(
             task=task,
@@ -198,6 +365,8 @@ def run_agent_cmd(
         logger.exception("Error running agent: %s", e)
         console.print(f"[red]Error: {e}[/red]")
         raise typer.Exit(code=1) from None
+    finally:
+        _close_response_cache(llm_client)
 
 
 @app.command("run-agent-suite")
@@ -211,17 +380,47 @@ def run_agent_suite_cmd(
         "--log-llm-messages/--no-log-llm-messages",
         help="Write LLM request/response pairs to llm_messages.jsonl.",
     ),
+    llm_cache: bool | None = typer.Option(
+        None,
+        "--llm-cache/--no-llm-cache",
+        help="Serve identical LLM requests from <out>/.llm_cache (default: AGENTBENCH_LLM_CACHE).",
+    ),
     skip_baseline: bool = typer.Option(
         False,
         "--skip-baseline",
         help="Skip baseline validation before running the agent.",
     ),
+    concurrency: int = typer.Option(
+        1,
+        "--concurrency",
+        "-j",
+        min=1,
+        help="Number of tasks to run in parallel.",
+    ),
+    quiet: bool = typer.Option(
+        False,
+        "--quiet",
+        "-q",
+        help="Only print the final suite summary table.",
+    ),
+    resume: bool = typer.Option(
+        True,
+        "--resume/--no-resume",
+        help="Skip tasks already completed by this variant and model (see completed.jsonl).",
+    ),
 ):
     """
-    Run an agent on every task in a suite sequentially.
+    Run an agent on every task in a suite.
 
-    Artifacts are written under <out>/suite_runs/<suite>/<task_id>/.
+    Tasks run sequentially by default; --concurrency N runs up to N at once.
+    Artifacts are written under <out>/suite_runs/<suite>/<task_id>/, and each
+    finished attempt is checkpointed to <out>/suite_runs/<suite>/completed.jsonl
+    so an interrupted suite picks up where it stopped.
     """
+    from agentbench.agent_runner import run_agent_attempt
+    from agentbench.agents.loop import interrupt_event
+    from agentbench.util.jsonl import append_jsonl
+
     try:
         tasks = load_suite(tasks_root=tasks_root, suite_name=suite)
     except SuiteNotFoundError:
@@ -232,31 +431,28 @@ def run_agent_suite_cmd(
         console.print(f"[yellow]No tasks found in suite '{suite}'[/yellow]")
         raise typer.Exit(code=1)
 
+    checkpoint_path = out_dir / "suite_runs" / suite / "completed.jsonl"
+    model_name = _llm_model_name() if variant == "llm_v0" else None
+    completed = (
+        _load_suite_checkpoint(checkpoint_path, variant, model_name) if resume else {}
+    )
+    pending = [task for task in tasks if task.id not in completed]
+    if len(pending) < len(tasks):
+        console.print(
+            f"[dim]Resuming: skipping {len(tasks) - len(pending)} task(s) "
+            f"already completed ({checkpoint_path})[/dim]"
+        )
+
     llm_config = None
     llm_client = None
-    if variant == "llm_v0":
-        api_key_str = os.getenv("OPENROUTER_API_KEY")
-        if not api_key_str:
-            console.print("[red]Error: OPENROUTER_API_KEY environment variable is required for llm_v0[/red]")
-            raise typer.Exit(code=1)
-        model_name = os.getenv("MODEL_NAME", "anthropic/claude-3.5-sonnet")
-        llm_config = LLMConfig(
-            provider_config=ProviderConfig(
-                provider=LLMProvider.OPENROUTER,
-                model_name=model_name,
-                api_key=SecretStr(api_key_str),
-                timeout_sec=120,
-            )
-        )
-        llm_client = OpenRouterClient(config=llm_config)
+    if variant == "llm_v0" and pending:
+        llm_config, llm_client = _build_llm_client(out_dir, llm_cache)
 
-    results: list[AttemptRecord] = []
-    for task in tasks:
-        console.print(f"[bold blue]Running agent '{variant}' on task '{task.id}'...[/bold blue]")
+    def _run_one(task: TaskSpec) -> tuple["AttemptRecord", Path]:
         workspace_dir = out_dir / "suite_runs" / suite / task.id / "workspace"
         artifacts_dir = out_dir / "suite_runs" / suite / task.id / "agent_runs"
         if workspace_dir.exists():
-            shutil.rmtree(workspace_dir, ignore_errors=True)
+            _fast_rmtree(workspace_dir)
         workspace_dir.mkdir(parents=True, exist_ok=True)
         artifacts_dir.mkdir(parents=True, exist_ok=True)
 
@@ -270,26 +466,65 @@ def run_agent_suite_cmd(
             log_llm_messages=log_llm_messages,
             skip_baseline=skip_baseline,
         )
-        results.append(record)
-        print_agent_summary(record)
-        console.print(f"[dim]Artifacts saved to: {artifacts_dir}[/dim]\n")
+        if record.result.failure_reason not in _RETRY_ON_RESUME:
+            append_jsonl(checkpoint_path, record.model_dump_json())
+        return record, artifacts_dir
+
+    def _report(record: "AttemptRecord", artifacts_dir: Path) -> None:
+        if not quiet:
+            print_agent_summary(record, artifacts_dir)
+
+    try:
+        # Attempts are I/O-bound (LLM calls, container runs), so threads give
+        # near-linear speedup. Summaries stream as each task finishes; the suite
+        # table below keeps the suite's task order.
+        results_by_id: dict[str, "AttemptRecord"] = dict(completed)
+        if concurrency == 1:
+            for task in pending:
+                if not quiet:
+                    console.print(f"[bold blue]Running agent '{variant}' on task '{task.id}'...[/bold blue]")
+                record, artifacts_dir = _run_one(task)
+                results_by_id[task.id] = record
+                _report(record, artifacts_dir)
+        elif pending:
+            console.print(
+                f"[bold blue]Running agent '{variant}' on {len(pending)} tasks "
+                f"(concurrency {concurrency})...[/bold blue]"
+            )
+            interrupt_event.clear()
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                futures = {executor.submit(_run_one, task): task.id for task in pending}
+                try:
+                    for future in as_completed(futures):
+                        record, artifacts_dir = future.result()
+                        results_by_id[futures[future]] = record
+                        _report(record, artifacts_dir)
+                except KeyboardInterrupt:
+                    # Workers never see SIGINT; stop their loops and drop queued
+                    # tasks, then let the running ones record the interruption.
+                    interrupt_event.set()
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    console.print("[yellow]Suite run interrupted.[/yellow]")
+                    raise typer.Exit(code=130)
+                finally:
+                    interrupt_event.clear()
+    finally:
+        _close_response_cache(llm_client)
+
+    results = [results_by_id[task.id] for task in tasks]
 
     # Suite summary
-    summary = Table(title=f"Suite Run Summary: {suite}")
-    summary.add_column("Task", style="cyan")
-    summary.add_column("Success", style="green")
-    summary.add_column("Exit", style="magenta")
-    summary.add_column("Stop Reason", style="yellow")
-    summary.add_column("Failure Reason", style="red")
-    for rec in results:
-        summary.add_row(
+    rows = [
+        (
             rec.task_id,
             "✓" if rec.result.passed else "✗",
             str(rec.result.exit_code),
-            str(rec.result.stop_reason or ""),
-            str(rec.result.failure_reason or ""),
+            rec.result.stop_reason.value if rec.result.stop_reason else "",
+            rec.result.failure_reason.value if rec.result.failure_reason else "",
         )
-    console.print(summary)
+        for rec in results
+    ]
+    print_suite_summary(suite, rows)
 
 
 @app.command("validate-suite")
@@ -365,7 +600,7 @@ def main():
 
     Run tasks in isolated Docker containers and capture results.
     """
-    pass
+    setup_logging()
 
 
 if __name__ == "__main__":  # pragma: no cover
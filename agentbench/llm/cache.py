@@ -0,0 +1,70 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+from pathlib import Path
+
+from agentbench.llm.messages import LLMResponse
+
+logger = logging.getLogger(__name__)
+
+LLM_CACHE_ENV = "AGENTBENCH_LLM_CACHE"
+
+
+def llm_cache_enabled(flag: bool | None) -> bool:
+    """Resolve the --llm-cache flag, falling back to AGENTBENCH_LLM_CACHE."""
+    if flag is not None:
+        return flag
+    return os.getenv(LLM_CACHE_ENV, "").lower() in ("1", "true", "yes", "on")
+
+
+class ResponseCache:
+    """SQLite-backed cache of LLM responses keyed on the full request body.
+
+    The request body already carries the model name, sampling parameters,
+    input items and tool definitions, so identical bodies are safe to serve
+    from disk. A single instance may be shared across threads.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, body TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(request_body: dict) -> str:
+        payload = json.dumps(request_body, sort_keys=True, separators=(",", ":"))
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> LLMResponse | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            return LLMResponse.model_validate_json(row[0])
+        except ValueError:
+            logger.warning("Discarding unreadable cached LLM response %s", key)
+            return None
+
+    def put(self, key: str, response: LLMResponse) -> None:
+        body = response.model_dump_json()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, body) VALUES (?, ?)",
+                (key, body),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from agentbench.llm.config import LLMConfig
 from agentbench.llm.messages import (
@@ -36,11 +37,46 @@ class LLMClient(ABC):
         """
         pass
 
+    async def complete_batch(
+        self,
+        batch: list[list[InputItem]],
+        tools: list[ToolDefinition] | None = None,
+        event_logger: EventLogger | NullEventLogger | None = None,
+    ) -> list[LLMResponse]:
+        """Send several independent completion requests concurrently.
+
+        At most provider_config.max_concurrency requests are in flight at
+        once. Providers without a native batch endpoint fan out over
+        complete(); results are returned in the order of the batch.
+
+        Raises:
+            LLMError: The first failure among the requests.
+        """
+        semaphore = asyncio.Semaphore(self.config.provider_config.max_concurrency)
+
+        async def _complete_one(input_items: list[InputItem]) -> LLMResponse:
+            async with semaphore:
+                return await self.complete(
+                    input_items, tools=tools, event_logger=event_logger
+                )
+
+        return list(await asyncio.gather(*(_complete_one(items) for items in batch)))
+
     @abstractmethod
     def count_tokens(self, input_items: list[InputItem]) -> int:
         """Estimate token count for input items."""
         pass
 
+    async def aclose(self) -> None:
+        """Release pooled connections held for the running event loop."""
+        return None
+
+    async def __aenter__(self) -> "LLMClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
     @property
     def model_name(self) -> str:
         return self.config.provider_config.model_name
@@ -1,4 +1,3 @@
-import json
 from enum import StrEnum
 from pydantic import BaseModel, Field, SecretStr
 from typing import Any
@@ -53,6 +52,11 @@ class ProviderConfig(BaseModel):
         ge = 10,
         le = 600
     )
+    max_concurrency: int = Field(
+        default = 8,
+        ge = 1,
+        le = 64
+    )
 
 class LLMConfig(BaseModel):
     provider_config: ProviderConfig
@@ -65,7 +69,7 @@ class LLMConfig(BaseModel):
     prompt_version: str | None = None
 
     def to_safe_dict(self) -> dict[str, Any]:
-        data = json.loads(self.model_dump_json())
+        data = self.model_dump(mode="json")
 
         if "provider_config" in data and "api_key" in data["provider_config"]:
             data["provider_config"]["api_key"] = "[REDACTED]"
@@ -1,3 +1,5 @@
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from enum import StrEnum
 from agentbench.scoring.taxonomy import FailureReason
 
@@ -32,11 +34,50 @@ class LLMError(Exception):
         return FailureReason.LLM_ERROR
 
 
+# HTTP status -> (error type, retryable). Statuses not listed are treated as
+# retryable provider errors.
+STATUS_ERROR_TYPES: dict[int, tuple[LLMErrorType, bool]] = {
+    400: (LLMErrorType.INVALID_REQUEST, False),
+    401: (LLMErrorType.AUTH_FAILED, False),
+    402: (LLMErrorType.AUTH_FAILED, False),
+    403: (LLMErrorType.AUTH_FAILED, False),
+    429: (LLMErrorType.RATE_LIMITED, True),
+    500: (LLMErrorType.PROVIDER_ERROR, True),
+    502: (LLMErrorType.PROVIDER_ERROR, True),
+    503: (LLMErrorType.PROVIDER_ERROR, True),
+}
+_DEFAULT_STATUS_ERROR = (LLMErrorType.PROVIDER_ERROR, True)
+
+
+def error_from_status(status_code: int, message: str) -> LLMError:
+    """Build the LLMError for an HTTP status with a single table lookup."""
+    error_type, retryable = STATUS_ERROR_TYPES.get(status_code, _DEFAULT_STATUS_ERROR)
+    return LLMError(error_type, message, retryable=retryable)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
 class RateLimitedError(LLMError):
     def __init__(
         self,
         message: str,
-        retry_after_sec: int | None = None
+        retry_after_sec: float | None = None
     ):
         super().__init__(
             LLMErrorType.RATE_LIMITED,
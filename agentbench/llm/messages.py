@@ -3,9 +3,10 @@ API Reference: https://openrouter.ai/docs/api/reference/responses/basic-usage
 """
 
 from enum import StrEnum
+from operator import is_
 from datetime import datetime
-from pydantic import BaseModel, Field, model_validator
-from typing import Any, Literal
+from pydantic import BaseModel, ConfigDict, Discriminator, Field, PrivateAttr, Tag, model_validator
+from typing import Annotated, Any, Callable, Literal
 
 class MessageRole(StrEnum):
     USER = "user"
@@ -31,14 +32,20 @@ class FunctionCall(BaseModel):
     name: str
     arguments: str
 class FunctionCallOutput(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     type: Literal["function_call_output"] = "function_call_output"
     id: str
     call_id: str
     output: str
 
-InputItem = InputMessage | FunctionCall | FunctionCallOutput
+InputItem = Annotated[
+    InputMessage | FunctionCall | FunctionCallOutput, Field(discriminator="type")
+]
 
 class ToolDefinition(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     type: Literal["function"] = "function"
     name: str
     description: str
@@ -52,6 +59,34 @@ class OutputMessage(BaseModel):
     role: Literal["assistant"] = "assistant"
     status: str | None = None  # "completed", "in_progress", etc.
     content: list[OutputContent] | str | None = None
+
+
+def _normalize_call_payload(data: Any) -> Any:
+    """Map provider call shapes (nested function, tool_name, args) onto our fields."""
+    if not isinstance(data, dict):
+        return data
+    if (
+        data.get("call_id")
+        and "name" in data
+        and "function" not in data
+        and "tool_name" not in data
+        and "args" not in data
+    ):
+        return data
+    updated = dict(data)
+    func = updated.get("function")
+    if isinstance(func, dict):
+        updated.setdefault("name", func.get("name"))
+        updated.setdefault("arguments", func.get("arguments"))
+    if "tool_name" in updated and "name" not in updated:
+        updated["name"] = updated.get("tool_name")
+    if "args" in updated and "arguments" not in updated:
+        updated["arguments"] = updated.get("args")
+    if updated.get("id") and not updated.get("call_id"):
+        updated["call_id"] = updated["id"]
+    return updated
+
+
 class OutputFunctionCall(BaseModel):
     type: Literal["function_call"] = "function_call"
     id: str | None = None
@@ -63,20 +98,7 @@ class OutputFunctionCall(BaseModel):
     @model_validator(mode="before")
     @classmethod
     def _normalize_payload(cls, data: Any) -> Any:
-        if not isinstance(data, dict):
-            return data
-        updated = dict(data)
-        func = updated.get("function")
-        if isinstance(func, dict):
-            updated.setdefault("name", func.get("name"))
-            updated.setdefault("arguments", func.get("arguments"))
-        if "tool_name" in updated and "name" not in updated:
-            updated["name"] = updated.get("tool_name")
-        if "args" in updated and "arguments" not in updated:
-            updated["arguments"] = updated.get("args")
-        if updated.get("id") and not updated.get("call_id"):
-            updated["call_id"] = updated["id"]
-        return updated
+        return _normalize_call_payload(data)
 
 class OutputToolCall(BaseModel):
     type: Literal["tool_call"] = "tool_call"
@@ -89,35 +111,56 @@ class OutputToolCall(BaseModel):
     @model_validator(mode="before")
     @classmethod
     def _normalize_payload(cls, data: Any) -> Any:
-        if not isinstance(data, dict):
-            return data
-        updated = dict(data)
-        func = updated.get("function")
-        if isinstance(func, dict):
-            updated.setdefault("name", func.get("name"))
-            updated.setdefault("arguments", func.get("arguments"))
-        if "tool_name" in updated and "name" not in updated:
-            updated["name"] = updated.get("tool_name")
-        if "args" in updated and "arguments" not in updated:
-            updated["arguments"] = updated.get("args")
-        if updated.get("id") and not updated.get("call_id"):
-            updated["call_id"] = updated["id"]
-        return updated
+        return _normalize_call_payload(data)
 
 class OutputReasoning(BaseModel):
     """Reasoning/chain-of-thought output from models like o3, grok, deepseek."""
+    model_config = ConfigDict(defer_build=True)
+
     type: Literal["reasoning"] = "reasoning"
     id: str | None = None
     content: list[Any] | str | None = None  # Can be text or structured content
 
 
-OutputItem = OutputMessage | OutputFunctionCall | OutputToolCall | OutputReasoning | dict[str, Any]
+_OUTPUT_ITEM_TYPES = frozenset({"message", "function_call", "tool_call", "reasoning"})
+
+
+def _output_item_tag(value: Any) -> str:
+    """Pick the OutputItem arm from the item's type; unknown types stay plain dicts."""
+    if isinstance(value, dict):
+        item_type = value.get("type", "message")
+    else:
+        item_type = getattr(value, "type", None)
+    return item_type if item_type in _OUTPUT_ITEM_TYPES else "other"
+
+
+def _or_dict(model: type[BaseModel], tag: str) -> Any:
+    """Tagged arm that degrades to a plain dict when the item doesn't fit the model."""
+    return Annotated[
+        model | dict[str, Any], Field(union_mode="left_to_right"), Tag(tag)
+    ]
+
+
+# Tagged so pydantic-core dispatches on "type" instead of trying each arm;
+# a malformed item of a known type stays a dict rather than failing the response.
+OutputItem = Annotated[
+    _or_dict(OutputMessage, "message")
+    | _or_dict(OutputFunctionCall, "function_call")
+    | _or_dict(OutputToolCall, "tool_call")
+    | _or_dict(OutputReasoning, "reasoning")
+    | Annotated[dict[str, Any], Tag("other")],
+    Discriminator(_output_item_tag),
+]
 
 class InputTokensDetails(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     cached_tokens: int = 0
 
 
 class OutputTokensDetails(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     reasoning_tokens: int = 0
 
 
@@ -127,6 +170,55 @@ class TokenUsage(BaseModel):
     total_tokens: int = 0
     input_tokens_details: InputTokensDetails | None = None
     output_tokens_details: OutputTokensDetails | None = None
+
+
+def _message_text(item: OutputMessage) -> str | None:
+    content = item.content
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        for part in content:
+            if isinstance(part, OutputTextContent):
+                return part.text
+            if isinstance(part, str):
+                return part
+            if isinstance(part, dict):
+                text = part.get("text")
+                if text:
+                    return text
+    return None
+
+
+def _dict_text(item: dict[str, Any]) -> str | None:
+    if item.get("type") == "message":
+        content = item.get("content")
+        if isinstance(content, str):
+            return content
+        if isinstance(content, list):
+            for part in content:
+                if isinstance(part, str):
+                    return part
+                if isinstance(part, dict):
+                    text = part.get("text")
+                    if text:
+                        return text
+    if item.get("type") in {"output_text", "text"}:
+        text = item.get("text")
+        if isinstance(text, str):
+            return text
+    return None
+
+
+# Output items are dispatched on their exact type: a dict lookup is cheaper
+# than a chain of isinstance checks against pydantic model classes.
+_TEXT_EXTRACTORS: dict[type, Callable[[Any], str | None]] = {
+    OutputMessage: _message_text,
+    dict: _dict_text,
+}
+_CALL_ITEM_TYPES = frozenset({OutputFunctionCall, OutputToolCall})
+_CALL_DICT_TYPES = frozenset({"function_call", "tool_call"})
+
+
 class LLMResponse(BaseModel):
     id: str | None = None
     object: str = "response"
@@ -139,12 +231,25 @@ class LLMResponse(BaseModel):
     latency_ms: int = 0
     timestamp: datetime = Field(default_factory=datetime.now)
 
+    _index: tuple[tuple[Any, ...], str | None, list[Any]] | None = PrivateAttr(default=None)
+
     @model_validator(mode="before")
     @classmethod
     def _normalize_payload(cls, data: Any) -> Any:
         if not isinstance(data, dict):
             return data
 
+        # Fast path: a native Responses API payload needs no rewriting.
+        usage = data.get("usage")
+        if (
+            isinstance(data.get("output"), list)
+            and "object" in data
+            and "status" in data
+            and ("created_at" in data or "created" not in data)
+            and (not isinstance(usage, dict) or "input_tokens" in usage)
+        ):
+            return data
+
         if "created_at" not in data and "created" in data:
             data["created_at"] = data["created"]
 
@@ -176,8 +281,34 @@ class LLMResponse(BaseModel):
 
     @classmethod
     def _from_chat_completions(cls, data: dict[str, Any]) -> dict[str, Any]:
+        # Items whose fields are all built here (plain-string content, string
+        # call fields) are created with model_construct; validation then only
+        # needs an isinstance check. Anything else stays a dict and is validated.
         choices = data.get("choices") or []
-        output: list[dict[str, Any]] = []
+
+        # Fast path: one choice carrying plain text and no tool calls.
+        if len(choices) == 1 and isinstance(choices[0], dict):
+            message = choices[0].get("message") or {}
+            content = message.get("content")
+            message_id = message.get("id") or "msg_0"
+            if (
+                isinstance(content, str)
+                and isinstance(message_id, str)
+                and "tool_calls" not in message
+                and "function_call" not in message
+            ):
+                data["output"] = [
+                    OutputMessage.model_construct(
+                        id=message_id,
+                        status="completed",
+                        content=[OutputTextContent.model_construct(text=content)],
+                    )
+                ]
+                data.setdefault("object", "response")
+                data.setdefault("status", "completed")
+                return data
+
+        output: list[OutputItem] = []
 
         for index, choice in enumerate(choices):
             message = {}
@@ -185,21 +316,25 @@ class LLMResponse(BaseModel):
                 message = choice.get("message") or {}
 
             content = message.get("content")
-            if isinstance(content, list):
-                content_value = content
+            message_id = message.get("id") or f"msg_{index}"
+            if isinstance(content, str) and isinstance(message_id, str):
+                output.append(
+                    OutputMessage.model_construct(
+                        id=message_id,
+                        status="completed",
+                        content=[OutputTextContent.model_construct(text=content)],
+                    )
+                )
             elif content is not None:
-                content_value = [{"type": "output_text", "text": content}]
-            else:
-                content_value = None
-
-            if content_value is not None:
                 output.append(
                     {
                         "type": "message",
-                        "id": message.get("id") or f"msg_{index}",
+                        "id": message_id,
                         "role": "assistant",
                         "status": "completed",
-                        "content": content_value,
+                        "content": content
+                        if isinstance(content, list)
+                        else [{"type": "output_text", "text": content}],
                     }
                 )
 
@@ -216,6 +351,16 @@ class LLMResponse(BaseModel):
                     name = call.get("name") or function.get("name") or ""
                     arguments = call.get("arguments") or function.get("arguments") or ""
                     call_id = call.get("id") or f"call_{index}"
+                    if all(isinstance(value, str) for value in (name, arguments, call_id)):
+                        output.append(
+                            OutputFunctionCall.model_construct(
+                                id=call_id,
+                                call_id=call_id,
+                                name=name,
+                                arguments=arguments,
+                            )
+                        )
+                        continue
                     output.append(
                         {
                             "type": "function_call",
@@ -232,57 +377,48 @@ class LLMResponse(BaseModel):
         data.setdefault("status", "completed")
         return data
 
+    def _output_index(self) -> tuple[str | None, list[OutputFunctionCall | OutputToolCall | dict[str, Any]]]:
+        """Walk the output once for the first text and all tool calls.
+
+        The result is reused while the output holds the very same items;
+        the snapshot keeps them alive, so identities cannot be recycled.
+        """
+        items = tuple(self.output)
+        cached = self._index
+        if (
+            cached is not None
+            and len(cached[0]) == len(items)
+            and all(map(is_, cached[0], items))
+        ):
+            return cached[1], cached[2]
+
+        first_text: str | None = None
+        calls: list[OutputFunctionCall | OutputToolCall | dict[str, Any]] = []
+        for item in items:
+            item_type = type(item)
+            if item_type in _CALL_ITEM_TYPES or (
+                item_type is dict and item.get("type") in _CALL_DICT_TYPES
+            ):
+                calls.append(item)
+            elif first_text is None:
+                extract = _TEXT_EXTRACTORS.get(item_type)
+                if extract is not None:
+                    first_text = extract(item)
+
+        self._index = (items, first_text, calls)
+        return first_text, calls
+
     @property
     def has_tool_calls(self) -> bool:
         """Check if the response contains any function calls."""
-        return any(
-            isinstance(item, (OutputFunctionCall, OutputToolCall)) or
-            (isinstance(item, dict) and item.get("type") in {"function_call", "tool_call"})
-            for item in self.output
-        )
+        return bool(self._output_index()[1])
 
     @property
     def text_content(self) -> str | None:
         """Extract the text content from the first message output."""
-        for item in self.output:
-            if isinstance(item, OutputMessage):
-                content = item.content
-                if isinstance(content, str):
-                    return content
-                if isinstance(content, list):
-                    for part in content:
-                        if isinstance(part, OutputTextContent):
-                            return part.text
-                        if isinstance(part, str):
-                            return part
-                        if isinstance(part, dict):
-                            text = part.get("text")
-                            if text:
-                                return text
-            elif isinstance(item, dict):
-                if item.get("type") == "message":
-                    content = item.get("content")
-                    if isinstance(content, str):
-                        return content
-                    if isinstance(content, list):
-                        for part in content:
-                            if isinstance(part, str):
-                                return part
-                            if isinstance(part, dict):
-                                text = part.get("text")
-                                if text:
-                                    return text
-                if item.get("type") in {"output_text", "text"}:
-                    text = item.get("text")
-                    if isinstance(text, str):
-                        return text
-        return None
+        return self._output_index()[0]
 
     @property
     def tool_calls(self) -> list[OutputFunctionCall | OutputToolCall | dict[str, Any]]:
         """Extract all function calls from the output."""
-        return [
-            item for item in self.output
-            if isinstance(item, (OutputFunctionCall, OutputToolCall)) or
-            (isinstance(item, dict) and item.get("type") in {"function_call", "tool_call"})
-        ]
+        return list(self._output_index()[1])
@@ -1,50 +1,181 @@
 import asyncio
-import json
+import random
+import threading
 import httpx
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
+from agentbench.llm.cache import ResponseCache
 from agentbench.llm.client import LLMClient
-from agentbench.llm.config import LLMConfig
+from agentbench.llm.config import LLMConfig, RetryPolicy
 from agentbench.llm.messages import (
+    FunctionCall,
+    FunctionCallOutput,
     InputItem,
+    InputMessage,
     ToolDefinition,
     LLMResponse,
 )
-from agentbench.llm.errors import AuthenticationError, LLMError, LLMErrorType, TimeoutError
+from agentbench.llm.errors import (
+    AuthenticationError,
+    LLMError,
+    LLMErrorType,
+    RateLimitedError,
+    TimeoutError,
+    error_from_status,
+    parse_retry_after,
+)
 from agentbench.util.events import EventLogger, NullEventLogger, NULL_EVENT_LOGGER
 
 OPENROUTER_API_URL = "https://openrouter.ai/api/v1/responses"
+OPENROUTER_AUTH_URL = "https://openrouter.ai/api/v1/auth/key"
+# Idle connections are kept for a minute so they survive the gaps between
+# agent steps (tool execution, test runs) instead of the 5s httpx default.
+HTTP_POOL_LIMITS = httpx.Limits(
+    max_connections=64, max_keepalive_connections=32, keepalive_expiry=60
+)
+
+# Built once per process; each dump serializes a whole list in one call.
+_INPUT_ITEMS_ADAPTER = TypeAdapter(list[InputItem])
+_TOOLS_ADAPTER = TypeAdapter(list[ToolDefinition])
+
+
+def _backoff_delay(policy: RetryPolicy, attempt: int) -> float:
+    """Exponential backoff for the given 1-based attempt, capped and jittered.
+
+    Jitter (x0.5-1.5) keeps concurrent suite tasks that hit the same 429 from
+    retrying in lockstep.
+    """
+    base = min(
+        policy.max_delay_sec,
+        policy.initial_delay_sec * (policy.exponential_base ** (attempt - 1)),
+    )
+    return min(policy.max_delay_sec, base * random.uniform(0.5, 1.5))
+
+
+def _error_body(response: httpx.Response) -> dict | None:
+    """Parse an error response's JSON body, skipping HTML/text gateway pages."""
+    if "json" not in response.headers.get("content-type", ""):
+        return None
+    try:
+        body = response.json()
+    except ValueError:
+        return None
+    return body if isinstance(body, dict) else None
+
+
+def _log_request_failure(
+    logger: EventLogger | NullEventLogger,
+    request_body: dict,
+    error: LLMError,
+    message: str | None = None,
+) -> None:
+    """Record a failed attempt in both the event log and the LLM message log."""
+    message = message if message is not None else str(error)
+    logger.log_llm_request_failed(
+        error_type=error.error_type.value,
+        message=message,
+        retryable=error.retryable,
+    )
+    logger.log_llm_messages(
+        request=request_body,
+        response=None,
+        error={
+            "error_type": error.error_type.value,
+            "message": message,
+            "retryable": error.retryable,
+        },
+    )
+
+
+async def _close_evicted_client(client: httpx.AsyncClient) -> None:
+    # The client's own loop is gone, so pooled connections may not close
+    # cleanly from here; the client is still marked closed either way.
+    try:
+        await client.aclose()
+    except (RuntimeError, httpx.HTTPError):
+        pass
+
 
 class OpenRouterClient(LLMClient):
 
-    def __init__(self, config: LLMConfig):
+    def __init__(self, config: LLMConfig, response_cache: ResponseCache | None = None):
         super().__init__(config)
-        self._client: httpx.AsyncClient | None = None
+        self.response_cache = response_cache
+        # httpx.AsyncClient is bound to the event loop it first runs on, so
+        # keep one pooled client per loop (suite tasks run agents on separate
+        # loops in separate threads).
+        self._clients: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+        # Guards _clients, which suite worker threads share (run-agent-suite -j).
+        self._clients_lock = threading.Lock()
+        self._headers: dict[str, str] | None = None
 
     def _get_headers(self) -> dict[str, str]:
+        if self._headers is not None:
+            return self._headers
+
         api_key = self.config.provider_config.api_key
 
         if not api_key:
             raise AuthenticationError("API key is required")
 
-        return {
+        self._headers = {
             "Authorization": f"Bearer {api_key.get_secret_value()}",
             "Content-Type": "application/json",
             "HTTP-Referer": "https://github.com/agentbench",
             "X-Title": "AgentBench"
         }
+        return self._headers
 
     async def _get_client(self) -> httpx.AsyncClient:
-        # Create a fresh client each time to avoid "Event loop is closed" errors
-        # when asyncio.run() is called multiple times (each call creates/closes a new loop)
-        return httpx.AsyncClient(
+        loop = asyncio.get_running_loop()
+        with self._clients_lock:
+            client = self._clients.get(loop)
+            if client is not None and not client.is_closed:
+                return client
+
+            # Loops that have since closed can no longer drive their clients.
+            evicted = [
+                self._clients.pop(other)
+                for other in list(self._clients)
+                if other.is_closed()
+            ]
+            client = httpx.AsyncClient(
+                timeout=self.config.provider_config.timeout_sec,
+                headers=self._get_headers(),
+                limits=HTTP_POOL_LIMITS,
+            )
+            self._clients[loop] = client
+
+        for stale in evicted:
+            await _close_evicted_client(stale)
+        return client
+
+    async def verify_auth(self) -> None:
+        """Fail fast if the provider rejects the API key.
+
+        Only an explicit 401/403 raises AuthenticationError; network or
+        provider hiccups are left to the retry loop of real requests.
+        """
+        async with httpx.AsyncClient(
             timeout=self.config.provider_config.timeout_sec,
             headers=self._get_headers(),
-        )
+        ) as client:
+            try:
+                response = await client.get(OPENROUTER_AUTH_URL)
+            except httpx.HTTPError:
+                return
+        if response.status_code in (401, 403):
+            raise AuthenticationError(
+                f"OpenRouter rejected the API key (HTTP {response.status_code})"
+            )
+
+    async def aclose(self) -> None:
+        with self._clients_lock:
+            client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
 
     async def close(self):
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        await self.aclose()
 
     def _build_request_body(
         self,
@@ -53,14 +184,14 @@ class OpenRouterClient(LLMClient):
     ) -> dict:
         body = {
             "model": self.model_name,
-            "input": [json.loads(item.model_dump_json()) for item in input_items],
+            "input": _INPUT_ITEMS_ADAPTER.dump_python(input_items, mode="json", exclude_none=True),
             "max_output_tokens": self.config.sampling.max_tokens,
             "temperature": self.config.sampling.temperature,
             "top_p": self.config.sampling.top_p,
         }
 
         if tools:
-            body["tools"] = [json.loads(tool.model_dump_json()) for tool in tools]
+            body["tools"] = _TOOLS_ADAPTER.dump_python(tools, mode="json", exclude_none=True)
             body["tool_choice"] = "auto"
         
         return body
@@ -68,23 +199,36 @@ class OpenRouterClient(LLMClient):
     def _classify_error(
         self,
         status_code: int,
-        response_body: dict | None
+        response_body: dict | None,
+        retry_after: str | None = None,
     ) -> LLMError:
-        error_map = {
-            401: (LLMErrorType.AUTH_FAILED, False),
-            402: (LLMErrorType.AUTH_FAILED, False),
-            403: (LLMErrorType.AUTH_FAILED, False),
-            429: (LLMErrorType.RATE_LIMITED, True),
-            500: (LLMErrorType.PROVIDER_ERROR, True),
-            502: (LLMErrorType.PROVIDER_ERROR, True),
-            503: (LLMErrorType.PROVIDER_ERROR, True),
-        }
-
-        error_type, retryable = error_map.get(status_code, (LLMErrorType.PROVIDER_ERROR, True))
-
         message = response_body.get("error", {}).get("message", f"HTTP {status_code}") if response_body else f"HTTP {status_code}"
 
-        return LLMError(error_type, message, retryable=retryable)
+        if status_code == 429:
+            return RateLimitedError(message, retry_after_sec=parse_retry_after(retry_after))
+        return error_from_status(status_code, message)
+
+    @staticmethod
+    def _parse_response(response: httpx.Response) -> LLMResponse:
+        # Parse and validate the raw bytes in one pydantic-core pass,
+        # without building an intermediate dict via json.loads.
+        try:
+            return LLMResponse.model_validate_json(response.content)
+        except ValidationError as e:
+            first_error = e.errors()[0]
+            if first_error["type"] == "json_invalid" or (
+                first_error["type"] == "model_type" and not first_error["loc"]
+            ):
+                raise LLMError(
+                    LLMErrorType.INVALID_RESPONSE,
+                    "Non-JSON response from provider",
+                    retryable=True,
+                ) from e
+            raise LLMError(
+                LLMErrorType.INVALID_RESPONSE,
+                f"Invalid response schema: {e.errors()[:1]}",
+                retryable=False,
+            ) from e
 
     async def complete(
         self,
@@ -94,6 +238,12 @@ class OpenRouterClient(LLMClient):
     ) -> LLMResponse:
         logger = event_logger or NULL_EVENT_LOGGER
         request_body = self._build_request_body(input_items, tools)
+        cache_key = None
+        if self.response_cache is not None:
+            cache_key = ResponseCache.make_key(request_body)
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return cached
         retry_policy = self.config.retry_policy
         max_attempts = retry_policy.max_retries + 1
         attempt = 0
@@ -108,145 +258,68 @@ class OpenRouterClient(LLMClient):
                 has_tools=tools is not None
             )
 
+            error: LLMError
+            message: str | None = None
             try:
                 response = await client.post(
                     OPENROUTER_API_URL,
                     json=request_body
                 )
-                try:
-                    response_body = response.json()
-                except ValueError:
-                    response_body = None
-                if response_body is not None and not isinstance(response_body, dict):
-                    response_body = None
-
                 if response.status_code != 200:
-                    raise self._classify_error(response.status_code, response_body)
-
-                if response_body is None:
-                    raise LLMError(
-                        LLMErrorType.INVALID_RESPONSE,
-                        "Non-JSON response from provider",
-                        retryable=True,
+                    # Expected on throttling/gateway errors; classified inline
+                    # rather than raised and caught on every retry.
+                    error = self._classify_error(
+                        response.status_code,
+                        _error_body(response),
+                        response.headers.get("retry-after"),
                     )
+                else:
+                    result = self._parse_response(response)
 
-                try:
-                    result = LLMResponse.model_validate(response_body)
-                except ValidationError as e:
-                    raise LLMError(
-                        LLMErrorType.INVALID_RESPONSE,
-                        f"Invalid response schema: {e.errors()[:1]}",
-                        retryable=False,
-                    ) from e
-
-                logger.log_llm_request_finished(
-                    request_id=result.id or "",
-                    status=result.status or "",
-                    latency_ms=result.latency_ms or 0,
-                    tokens_used=result.usage.total_tokens if result.usage else 0,
-                    has_tool_calls=result.has_tool_calls
-                )
-                logger.log_llm_messages(
-                    request=request_body,
-                    response=result.model_dump(mode="json"),
-                    error=None,
-                )
+                    logger.log_llm_request_finished(
+                        request_id=result.id or "",
+                        status=result.status or "",
+                        latency_ms=result.latency_ms or 0,
+                        tokens_used=result.usage.total_tokens if result.usage else 0,
+                        has_tool_calls=result.has_tool_calls
+                    )
+                    logger.log_llm_messages(
+                        request=request_body,
+                        response=result,
+                        error=None,
+                    )
 
-                return result
+                    if cache_key is not None:
+                        self.response_cache.put(cache_key, result)
+                    return result
 
             except httpx.TimeoutException as e:
                 error = TimeoutError(
                     f"Request timed out after {self.config.provider_config.timeout_sec} seconds"
                 )
-                logger.log_llm_request_failed(
-                    error_type=LLMErrorType.TIMEOUT.value,
-                    message=str(e),
-                    retryable=True
-                )
-                logger.log_llm_messages(
-                    request=request_body,
-                    response=None,
-                    error={
-                        "error_type": LLMErrorType.TIMEOUT.value,
-                        "message": str(e),
-                        "retryable": True,
-                    },
-                )
+                message = str(e)
             except httpx.HTTPStatusError as e:
-                error = self._classify_error(e.response.status_code, e.response.json())
-                logger.log_llm_request_failed(
-                    error_type=error.error_type.value,
-                    message=str(error),
-                    retryable=error.retryable
-                )
-                logger.log_llm_messages(
-                    request=request_body,
-                    response=None,
-                    error={
-                        "error_type": error.error_type.value,
-                        "message": str(error),
-                        "retryable": error.retryable,
-                    },
+                error = self._classify_error(
+                    e.response.status_code,
+                    _error_body(e.response),
+                    e.response.headers.get("retry-after"),
                 )
             except httpx.RequestError as e:
                 error = LLMError(LLMErrorType.NETWORK_ERROR, str(e), retryable=True)
-                logger.log_llm_request_failed(
-                    error_type=LLMErrorType.NETWORK_ERROR.value,
-                    message=str(e),
-                    retryable=True
-                )
-                logger.log_llm_messages(
-                    request=request_body,
-                    response=None,
-                    error={
-                        "error_type": LLMErrorType.NETWORK_ERROR.value,
-                        "message": str(e),
-                        "retryable": True,
-                    },
-                )
             except LLMError as e:
                 error = e
-                logger.log_llm_request_failed(
-                    error_type=e.error_type.value,
-                    message=str(e),
-                    retryable=e.retryable,
-                )
-                logger.log_llm_messages(
-                    request=request_body,
-                    response=None,
-                    error={
-                        "error_type": e.error_type.value,
-                        "message": str(e),
-                        "retryable": e.retryable,
-                    },
-                )
-            except Exception as e:
-                error = LLMError(LLMErrorType.PROVIDER_ERROR, str(e))
-                logger.log_llm_request_failed(
-                    error_type=LLMErrorType.PROVIDER_ERROR.value,
-                    message=str(e),
-                    retryable=False
-                )
-                logger.log_llm_messages(
-                    request=request_body,
-                    response=None,
-                    error={
-                        "error_type": LLMErrorType.PROVIDER_ERROR.value,
-                        "message": str(e),
-                        "retryable": False,
-                    },
-                )
-            finally:
-                await client.aclose()
+
+            _log_request_failure(logger, request_body, error, message)
 
             last_error = error
             if not error.retryable or attempt >= max_attempts:
                 raise error
 
-            delay = min(
-                retry_policy.max_delay_sec,
-                retry_policy.initial_delay_sec * (retry_policy.exponential_base ** (attempt - 1)),
-            )
+            delay = _backoff_delay(retry_policy, attempt)
+            retry_after = error.details.get("retry_after_sec")
+            if retry_after is not None:
+                # Wait at least as long as the provider asked, within max_delay_sec.
+                delay = max(delay, min(retry_after, retry_policy.max_delay_sec))
             if delay > 0:
                 await asyncio.sleep(delay)
 
@@ -255,5 +328,18 @@ class OpenRouterClient(LLMClient):
         raise LLMError(LLMErrorType.UNKNOWN, "Unknown OpenRouter error", retryable=False)
 
     def count_tokens(self, input_items: list[InputItem]) -> int:
-        total_chars = sum(len(str(item.model_dump())) for item in input_items)
+        # Count only the text the model actually reads; chars/4 is the estimate.
+        total_chars = 0
+        for item in input_items:
+            if isinstance(item, InputMessage):
+                if isinstance(item.content, str):
+                    total_chars += len(item.content)
+                else:
+                    total_chars += sum(len(part.text) for part in item.content)
+            elif isinstance(item, FunctionCall):
+                total_chars += len(item.name) + len(item.arguments)
+            elif isinstance(item, FunctionCallOutput):
+                total_chars += len(item.output)
+            else:
+                total_chars += len(item.model_dump_json())
         return total_chars // 4
@@ -0,0 +1,65 @@
+from pathlib import Path
+
+import pytest
+
+from agentbench.llm.cache import ResponseCache, llm_cache_enabled
+from agentbench.llm.messages import LLMResponse
+
+
+def make_response() -> LLMResponse:
+    return LLMResponse.model_validate(
+        {
+            "id": "resp_1",
+            "model": "test-model",
+            "status": "completed",
+            "output": [
+                {
+                    "type": "message",
+                    "role": "assistant",
+                    "content": [{"type": "output_text", "text": "ok"}],
+                }
+            ],
+            "usage": {"input_tokens": 1, "output_tokens": 1, "total_tokens": 2},
+        }
+    )
+
+
+def test_round_trips_response(tmp_path: Path):
+    cache = ResponseCache(tmp_path / "cache" / "responses.sqlite3")
+    key = ResponseCache.make_key({"model": "m", "input": [{"role": "user"}]})
+
+    assert cache.get(key) is None
+    cache.put(key, make_response())
+    cached = cache.get(key)
+    cache.close()
+
+    assert cached is not None
+    assert cached.text_content == "ok"
+    assert cached.usage.total_tokens == 2
+
+
+def test_key_ignores_dict_ordering_but_not_content():
+    first = ResponseCache.make_key({"model": "m", "temperature": 0.0})
+    reordered = ResponseCache.make_key({"temperature": 0.0, "model": "m"})
+    different = ResponseCache.make_key({"model": "m", "temperature": 0.5})
+
+    assert first == reordered
+    assert first != different
+
+
+@pytest.mark.parametrize(
+    ("flag", "env", "expected"),
+    [
+        (True, None, True),
+        (False, "1", False),
+        (None, "1", True),
+        (None, None, False),
+    ],
+)
+def test_llm_cache_enabled(monkeypatch, flag, env, expected):
+    if env is None:
+        monkeypatch.delenv("AGENTBENCH_LLM_CACHE", raising=False)
+    else:
+        monkeypatch.setenv("AGENTBENCH_LLM_CACHE", env)
+
+    assert llm_cache_enabled(flag) is expected
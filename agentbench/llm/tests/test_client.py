@@ -0,0 +1,72 @@
+import asyncio
+
+from pydantic import SecretStr
+
+from agentbench.llm.client import LLMClient
+from agentbench.llm.config import LLMConfig, LLMProvider, ProviderConfig
+from agentbench.llm.messages import InputMessage, LLMResponse, MessageRole
+
+
+class EchoClient(LLMClient):
+    """Answers each request with its own text and tracks peak concurrency."""
+
+    def __init__(self, config: LLMConfig):
+        super().__init__(config)
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def complete(self, input_items, tools=None, event_logger=None):
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        text = input_items[0].content
+        return LLMResponse.model_validate(
+            {
+                "output": [
+                    {
+                        "type": "message",
+                        "role": "assistant",
+                        "content": [{"type": "output_text", "text": text}],
+                    }
+                ]
+            }
+        )
+
+    def count_tokens(self, input_items):
+        return 0
+
+
+def make_client(max_concurrency: int) -> EchoClient:
+    return EchoClient(
+        LLMConfig(
+            provider_config=ProviderConfig(
+                provider=LLMProvider.OPENROUTER,
+                model_name="test-model",
+                api_key=SecretStr("test-key"),
+                max_concurrency=max_concurrency,
+            )
+        )
+    )
+
+
+def test_complete_batch_preserves_order():
+    client = make_client(max_concurrency=4)
+    batch = [
+        [InputMessage(role=MessageRole.USER, content=f"prompt-{i}")] for i in range(6)
+    ]
+
+    responses = asyncio.run(client.complete_batch(batch))
+
+    assert [r.text_content for r in responses] == [f"prompt-{i}" for i in range(6)]
+
+
+def test_complete_batch_bounds_in_flight_requests():
+    client = make_client(max_concurrency=2)
+    batch = [
+        [InputMessage(role=MessageRole.USER, content=str(i))] for i in range(5)
+    ]
+
+    asyncio.run(client.complete_batch(batch))
+
+    assert client.peak_in_flight == 2
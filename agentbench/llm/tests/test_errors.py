@@ -21,6 +21,8 @@ from agentbench.llm.errors import (
     InvalidRequestError,
     ProviderError,
     ContentFilterError,
+    error_from_status,
+    parse_retry_after,
 )
 from agentbench.scoring.taxonomy import FailureReason
 
@@ -216,6 +218,28 @@ class TestContentFilterError:
         assert error.error_type == LLMErrorType.CONTENT_FILTER
 
 
+class TestErrorFromStatus:
+    """Tests for the status-code dispatch table."""
+
+    @pytest.mark.parametrize(
+        ("status", "error_type", "retryable"),
+        [
+            (400, LLMErrorType.INVALID_REQUEST, False),
+            (401, LLMErrorType.AUTH_FAILED, False),
+            (429, LLMErrorType.RATE_LIMITED, True),
+            (503, LLMErrorType.PROVIDER_ERROR, True),
+            (599, LLMErrorType.PROVIDER_ERROR, True),
+        ],
+    )
+    def test_maps_status_to_error(self, status, error_type, retryable) -> None:
+        """Known statuses use the table; unknown ones default to provider errors."""
+        error = error_from_status(status, f"HTTP {status}")
+
+        assert error.error_type == error_type
+        assert error.retryable is retryable
+        assert str(error) == f"HTTP {status}"
+
+
 class TestAllErrorTypes:
     """Tests for all error types defined in the enum."""
 
@@ -237,3 +261,23 @@ class TestAllErrorTypes:
 
         for expected in expected_types:
             assert expected in actual_types, f"Missing error type: {expected}"
+
+
+class TestParseRetryAfter:
+    """Tests for Retry-After header parsing."""
+
+    def test_delta_seconds(self) -> None:
+        assert parse_retry_after("7") == 7.0
+        assert parse_retry_after(" 1.5 ") == 1.5
+
+    def test_http_date(self) -> None:
+        from datetime import datetime, timedelta, timezone
+        from email.utils import format_datetime
+
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+        delay = parse_retry_after(format_datetime(retry_at, usegmt=True))
+        assert delay is not None and 25 <= delay <= 30
+
+    def test_missing_or_garbage(self) -> None:
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
@@ -21,6 +21,7 @@ from agentbench.llm.messages import (
     FunctionCall,
     FunctionCallOutput,
     OutputFunctionCall,
+    OutputToolCall,
     ToolDefinition,
     TokenUsage,
     InputTokensDetails,
@@ -135,6 +136,16 @@ class TestOutputTypes:
         assert serialized["call_id"] == "call_xyz"
         assert serialized["name"] == "search"
 
+    def test_output_function_call_normalizes_provider_shapes(self) -> None:
+        """Nested function, tool_name and args map onto name/arguments/call_id."""
+        nested = OutputFunctionCall.model_validate(
+            {"id": "fc_1", "function": {"name": "read_file", "arguments": "{}"}}
+        )
+        aliased = OutputToolCall.model_validate({"tool_name": "search", "args": {"q": "x"}})
+
+        assert (nested.call_id, nested.name, nested.arguments) == ("fc_1", "read_file", "{}")
+        assert (aliased.name, aliased.arguments) == ("search", {"q": "x"})
+
 
 class TestLLMResponseHasToolCalls:
     """Tests for LLMResponse.has_tool_calls property."""
@@ -176,6 +187,27 @@ class TestLLMResponseHasToolCalls:
 
         assert response.has_tool_calls is False
 
+    def test_has_tool_calls_tracks_output_changes(self) -> None:
+        """The cached output index is rebuilt when the output list changes."""
+        response = LLMResponse(output=[OutputMessage(content="Thinking")])
+        assert response.has_tool_calls is False
+        assert response.text_content == "Thinking"
+
+        response.output.append(OutputFunctionCall(call_id="call_1", name="run", arguments="{}"))
+
+        assert response.has_tool_calls is True
+        assert [call.call_id for call in response.tool_calls] == ["call_1"]
+
+    def test_output_index_tracks_in_place_item_replacement(self) -> None:
+        """Replacing an item without resizing the list rebuilds the index."""
+        response = LLMResponse(output=[OutputMessage(content="Thinking")])
+        assert response.text_content == "Thinking"
+
+        response.output[0] = OutputFunctionCall(call_id="call_1", name="run", arguments="{}")
+
+        assert response.text_content is None
+        assert [call.call_id for call in response.tool_calls] == ["call_1"]
+
 
 class TestLLMResponseSerialization:
     """Tests for LLMResponse serialization round-trip."""
@@ -228,6 +260,102 @@ class TestLLMResponseSerialization:
 
         assert response.text_content == "This is the response text"
 
+    def test_native_payload_skips_normalization(self) -> None:
+        """A Responses API payload validates as-is and keeps its values."""
+        payload = {
+            "id": "resp_native",
+            "object": "response",
+            "created_at": 1704067200,
+            "model": "openai/gpt-4",
+            "status": "incomplete",
+            "output": [],
+            "usage": {"input_tokens": 3, "output_tokens": 2, "total_tokens": 5},
+        }
+
+        response = LLMResponse.model_validate(payload)
+
+        assert response.status == "incomplete"
+        assert response.usage.total_tokens == 5
+
+
+class TestChatCompletionsResponse:
+    """Tests for normalizing Chat Completions payloads into LLMResponse."""
+
+    def test_text_and_tool_calls_are_normalized(self) -> None:
+        response = LLMResponse.model_validate(
+            {
+                "choices": [
+                    {
+                        "message": {
+                            "content": "Listing files",
+                            "tool_calls": [
+                                {"id": "call_1", "function": {"name": "list_files", "arguments": "{}"}}
+                            ],
+                        }
+                    }
+                ],
+                "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+            }
+        )
+
+        message, call = response.output
+        assert isinstance(message, OutputMessage)
+        assert isinstance(message.content[0], OutputTextContent)
+        assert response.text_content == "Listing files"
+        assert isinstance(call, OutputFunctionCall)
+        assert (call.call_id, call.name, call.arguments) == ("call_1", "list_files", "{}")
+        assert response.usage.total_tokens == 15
+
+        restored = LLMResponse.model_validate_json(response.model_dump_json())
+        assert restored.output == response.output
+
+    def test_single_text_choice(self) -> None:
+        response = LLMResponse.model_validate(
+            {"id": "chatcmpl-1", "choices": [{"message": {"role": "assistant", "content": "Done."}}]}
+        )
+
+        (message,) = response.output
+        assert isinstance(message, OutputMessage)
+        assert message.id == "msg_0"
+        assert response.text_content == "Done."
+        assert response.has_tool_calls is False
+
+    def test_list_content_is_still_validated(self) -> None:
+        response = LLMResponse.model_validate(
+            {"choices": [{"message": {"content": [{"type": "output_text", "text": "hi"}]}}]}
+        )
+
+        assert isinstance(response.output[0].content[0], OutputTextContent)
+        assert response.text_content == "hi"
+
+
+class TestOutputItemDispatch:
+    """Tests for the type-tagged OutputItem union."""
+
+    def test_items_dispatch_on_type(self) -> None:
+        response = LLMResponse.model_validate(
+            {
+                "output": [
+                    {"type": "function_call", "call_id": "c1", "name": "run", "arguments": "{}"},
+                    {"role": "assistant", "content": "untyped message"},
+                    {"type": "web_search_call", "id": "ws_1"},
+                ]
+            }
+        )
+
+        call, message, unknown = response.output
+        assert isinstance(call, OutputFunctionCall)
+        assert isinstance(message, OutputMessage)
+        assert unknown == {"type": "web_search_call", "id": "ws_1"}
+
+    def test_malformed_known_items_fall_back_to_dict(self) -> None:
+        user_message = {"type": "message", "role": "user", "content": "echo"}
+        bad_content = {"type": "message", "content": 123}
+
+        response = LLMResponse.model_validate({"output": [user_message, bad_content]})
+
+        assert response.output == [user_message, bad_content]
+
 
 class TestTokenUsage:
     """Tests for TokenUsage with Responses API fields."""
@@ -1,12 +1,16 @@
 import asyncio
+import json
 import httpx
 import pytest
 from pydantic import SecretStr
 from agentbench.llm import openrouter as openrouter_module
-from agentbench.llm.openrouter import OpenRouterClient, OPENROUTER_API_URL
-from agentbench.llm.config import LLMConfig, ProviderConfig, LLMProvider, SamplingParams
+from agentbench.llm.openrouter import OpenRouterClient, OPENROUTER_API_URL, _backoff_delay
+from agentbench.llm.config import LLMConfig, ProviderConfig, LLMProvider, RetryPolicy, SamplingParams
 from agentbench.llm.messages import (
+    FunctionCall,
+    FunctionCallOutput,
     InputMessage,
+    InputTextContent,
     MessageRole,
     ToolDefinition,
 )
@@ -73,6 +77,24 @@ class TestBuildRequestBody:
         assert body["tools"][0]["type"] == "function"
         assert body["tool_choice"] == "auto"
 
+    def test_build_request_body_omits_unset_optional_fields(self):
+        client = OpenRouterClient(make_config())
+        tools = [
+            ToolDefinition(
+                name="run",
+                description="Run a command",
+                parameters={"properties": {"cwd": {"default": None}}},
+            )
+        ]
+
+        body = client._build_request_body(
+            [InputMessage(role=MessageRole.USER, content="hi")], tools
+        )
+
+        assert body["input"][0] == {"type": "message", "role": "user", "content": "hi"}
+        assert "strict" not in body["tools"][0]
+        assert body["tools"][0]["parameters"]["properties"]["cwd"] == {"default": None}
+
 
 class TestCountTokens:
     def test_count_tokens_uses_chars_heuristic(self):
@@ -85,6 +107,22 @@ class TestCountTokens:
         assert isinstance(count, int)
         assert count >= 0
 
+    def test_count_tokens_counts_plain_message_text(self):
+        client = OpenRouterClient(make_config())
+        items = [InputMessage(role=MessageRole.USER, content="x" * 400)]
+
+        assert client.count_tokens(items) == 100
+
+    def test_count_tokens_counts_tool_call_text(self):
+        client = OpenRouterClient(make_config())
+        items = [
+            InputMessage(role=MessageRole.USER, content=[InputTextContent(text="a" * 40)]),
+            FunctionCall(id="fc_1", call_id="call_1", name="run", arguments="b" * 37),
+            FunctionCallOutput(id="fco_1", call_id="call_1", output="c" * 80),
+        ]
+
+        assert client.count_tokens(items) == (40 + 3 + 37 + 80) // 4
+
 
 class TestClassifyError:
     def test_error_401_auth_failed(self):
@@ -124,6 +162,13 @@ class TestClassifyError:
         assert error.retryable is True
         assert "HTTP 502" in str(error)
 
+    def test_error_400_invalid_request_not_retried(self):
+        client = OpenRouterClient(make_config())
+        error = client._classify_error(400, {"error": {"message": "Bad input"}})
+
+        assert error.error_type == LLMErrorType.INVALID_REQUEST
+        assert error.retryable is False
+
     def test_error_unknown_status_defaults_to_provider_error(self):
         client = OpenRouterClient(make_config())
         error = client._classify_error(418, {"error": {"message": "I'm a teapot"}})
@@ -142,6 +187,11 @@ class TestGetHeaders:
         assert "HTTP-Referer" in headers
         assert "X-Title" in headers
 
+    def test_get_headers_is_built_once(self):
+        client = OpenRouterClient(make_config("my-secret-key"))
+
+        assert client._get_headers() is client._get_headers()
+
     def test_get_headers_raises_without_api_key(self):
         config = LLMConfig(
             provider_config=ProviderConfig(
@@ -174,6 +224,8 @@ class FakeResponse:
     def __init__(self, status_code: int, body: dict):
         self.status_code = status_code
         self._body = body
+        self.content = json.dumps(body).encode("utf-8")
+        self.headers = {"content-type": "application/json"}
 
     def json(self):
         return self._body
@@ -241,3 +293,245 @@ def test_complete_retries_on_network_error(monkeypatch: pytest.MonkeyPatch):
 
     assert result.status == "completed"
     assert state["index"] == 2
+
+
+def test_complete_retries_non_json_success_body(monkeypatch: pytest.MonkeyPatch):
+    config = make_config()
+    config.retry_policy.max_retries = 1
+    client = OpenRouterClient(config)
+
+    gateway_page = FakeResponse(200, {})
+    gateway_page.content = b"<html>Bad gateway</html>"
+    ok_body = {
+        "status": "completed",
+        "output": [{"type": "message", "role": "assistant", "content": "ok"}],
+    }
+    state = {"index": 0}
+    responses: list[object] = [gateway_page, FakeResponse(200, ok_body)]
+
+    async def fake_get_client(self):
+        return FakeClient(responses, state)
+
+    async def fake_sleep(_delay: float):
+        return None
+
+    monkeypatch.setattr(OpenRouterClient, "_get_client", fake_get_client)
+    monkeypatch.setattr(openrouter_module.asyncio, "sleep", fake_sleep)
+
+    result = asyncio.run(
+        client.complete([InputMessage(role=MessageRole.USER, content="hello")])
+    )
+
+    assert result.text_content == "ok"
+    assert state["index"] == 2
+
+
+def test_complete_retries_rate_limit_then_raises_last_error(monkeypatch: pytest.MonkeyPatch):
+    config = make_config()
+    config.retry_policy.max_retries = 1
+    client = OpenRouterClient(config)
+
+    state = {"index": 0}
+    throttled = {"error": {"message": "slow down"}}
+    responses: list[object] = [FakeResponse(429, throttled), FakeResponse(429, throttled)]
+
+    async def fake_get_client(self):
+        return FakeClient(responses, state)
+
+    async def fake_sleep(_delay: float):
+        return None
+
+    monkeypatch.setattr(OpenRouterClient, "_get_client", fake_get_client)
+    monkeypatch.setattr(openrouter_module.asyncio, "sleep", fake_sleep)
+
+    with pytest.raises(LLMError) as exc_info:
+        asyncio.run(client.complete([InputMessage(role=MessageRole.USER, content="hi")]))
+
+    assert exc_info.value.error_type == LLMErrorType.RATE_LIMITED
+    assert str(exc_info.value) == "slow down"
+    assert state["index"] == 2
+
+
+def test_complete_waits_for_retry_after_on_rate_limit(monkeypatch: pytest.MonkeyPatch):
+    config = make_config()
+    config.retry_policy.max_retries = 1
+    config.retry_policy.initial_delay_sec = 0.1
+    client = OpenRouterClient(config)
+
+    throttled = FakeResponse(429, {"error": {"message": "slow down"}})
+    throttled.headers["retry-after"] = "12"
+    ok_body = {"output": [{"type": "message", "role": "assistant", "content": "ok"}]}
+    state = {"index": 0}
+    responses: list[object] = [throttled, FakeResponse(200, ok_body)]
+    delays: list[float] = []
+
+    async def fake_get_client(self):
+        return FakeClient(responses, state)
+
+    async def fake_sleep(delay: float):
+        delays.append(delay)
+
+    monkeypatch.setattr(OpenRouterClient, "_get_client", fake_get_client)
+    monkeypatch.setattr(openrouter_module.asyncio, "sleep", fake_sleep)
+
+    result = asyncio.run(client.complete([InputMessage(role=MessageRole.USER, content="hi")]))
+
+    assert result.text_content == "ok"
+    assert delays == [12.0]
+
+
+def test_complete_propagates_unexpected_errors(monkeypatch: pytest.MonkeyPatch):
+    config = make_config()
+    config.retry_policy.max_retries = 1
+    client = OpenRouterClient(config)
+
+    state = {"index": 0}
+    responses: list[object] = [RuntimeError("bug in client code")]
+
+    async def fake_get_client(self):
+        return FakeClient(responses, state)
+
+    monkeypatch.setattr(OpenRouterClient, "_get_client", fake_get_client)
+
+    with pytest.raises(RuntimeError, match="bug in client code"):
+        asyncio.run(client.complete([InputMessage(role=MessageRole.USER, content="hi")]))
+
+    assert state["index"] == 1
+
+
+def test_error_body_skips_non_json_gateway_pages():
+    html = httpx.Response(502, headers={"content-type": "text/html"}, text="<html>502</html>")
+    provider = httpx.Response(429, json={"error": {"message": "slow down"}})
+
+    assert openrouter_module._error_body(html) is None
+    assert openrouter_module._error_body(provider) == {"error": {"message": "slow down"}}
+
+
+def test_get_client_reuses_pooled_client_within_loop():
+    client = OpenRouterClient(make_config())
+
+    async def fetch_twice():
+        first = await client._get_client()
+        second = await client._get_client()
+        await client.aclose()
+        return first, second
+
+    first, second = asyncio.run(fetch_twice())
+
+    assert first is second
+    assert first.is_closed
+
+
+def test_async_context_manager_closes_pooled_client():
+    async def run():
+        async with OpenRouterClient(make_config()) as client:
+            pooled = await client._get_client()
+        return client, pooled
+
+    client, pooled = asyncio.run(run())
+
+    assert pooled.is_closed
+    assert client._clients == {}
+
+
+def test_get_client_creates_new_client_per_event_loop():
+    client = OpenRouterClient(make_config())
+
+    first = asyncio.run(client._get_client())
+    second = asyncio.run(client._get_client())
+
+    assert first is not second
+    assert list(client._clients.values()) == [second]
+    assert first.is_closed
+
+
+def test_get_client_is_safe_across_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    client = OpenRouterClient(make_config())
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        clients = list(pool.map(lambda _: asyncio.run(client._get_client()), range(16)))
+
+    live = list(client._clients.values())
+    assert len(live) <= 8
+    assert all(c.is_closed for c in clients if c not in live)
+
+
+def test_complete_serves_repeated_request_from_response_cache(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+):
+    from agentbench.llm.cache import ResponseCache
+
+    cache = ResponseCache(tmp_path / "responses.sqlite3")
+    client = OpenRouterClient(make_config(), response_cache=cache)
+    state = {"index": 0}
+    response_body = {
+        "id": "resp_123",
+        "model": "test-model",
+        "status": "completed",
+        "output": [
+            {
+                "type": "message",
+                "role": "assistant",
+                "content": [{"type": "output_text", "text": "ok"}],
+            }
+        ],
+    }
+    responses: list[object] = [FakeResponse(200, response_body)]
+
+    async def fake_get_client(self):
+        return FakeClient(responses, state)
+
+    monkeypatch.setattr(OpenRouterClient, "_get_client", fake_get_client)
+    items = [InputMessage(role=MessageRole.USER, content="hello")]
+
+    first = asyncio.run(client.complete(items))
+    second = asyncio.run(client.complete(items))
+    cache.close()
+
+    assert state["index"] == 1
+    assert second.text_content == first.text_content == "ok"
+
+
+def _patch_async_client(monkeypatch: pytest.MonkeyPatch, handler) -> None:
+    real_async_client = httpx.AsyncClient
+
+    def make_client(**kwargs):
+        return real_async_client(transport=httpx.MockTransport(handler), **kwargs)
+
+    monkeypatch.setattr(openrouter_module.httpx, "AsyncClient", make_client)
+
+
+@pytest.mark.parametrize("status", [401, 403])
+def test_verify_auth_raises_on_rejected_key(monkeypatch: pytest.MonkeyPatch, status: int):
+    from agentbench.llm.errors import AuthenticationError
+
+    _patch_async_client(monkeypatch, lambda request: httpx.Response(status))
+    client = OpenRouterClient(make_config())
+
+    with pytest.raises(AuthenticationError):
+        asyncio.run(client.verify_auth())
+
+
+def test_verify_auth_tolerates_network_and_provider_errors(monkeypatch: pytest.MonkeyPatch):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers["Authorization"] == "Bearer test-key":
+            raise httpx.ConnectError("offline", request=request)
+        return httpx.Response(500)
+
+    _patch_async_client(monkeypatch, handler)
+
+    asyncio.run(OpenRouterClient(make_config()).verify_auth())
+    asyncio.run(OpenRouterClient(make_config("other-key")).verify_auth())
+
+
+def test_backoff_delay_is_jittered_and_capped():
+    policy = RetryPolicy(initial_delay_sec=1.0, max_delay_sec=5.0, exponential_base=2.0)
+
+    first = [_backoff_delay(policy, 1) for _ in range(50)]
+    late = [_backoff_delay(policy, 6) for _ in range(50)]
+
+    assert all(0.5 <= delay <= 1.5 for delay in first)
+    assert len(set(first)) > 1
+    assert all(2.5 <= delay <= 5.0 for delay in late)
@@ -4,29 +4,43 @@ import logging
 import sys
 
 
+_HANDLER_NAME = "agentbench"
+
+
 def setup_logging(level: int = logging.INFO) -> None:
     """
     Configure logging for the agentbench package.
 
+    Safe to call repeatedly: the handler is attached once and later calls
+    only update the level and point it at the current sys.stderr, which may
+    have been swapped since (e.g. by typer's CliRunner).
+
     Args:
         level: The logging level to use. Defaults to INFO.
     """
+    # Configure the root agentbench logger
+    logger = logging.getLogger("agentbench")
+    logger.setLevel(level)
+
+    # Prevent propagation to root logger to avoid duplicate logs
+    logger.propagate = False
+
+    for existing in logger.handlers:
+        if existing.get_name() == _HANDLER_NAME:
+            # Not setStream(): it flushes the old stream, which may be closed.
+            existing.stream = sys.stderr
+            return
+
     formatter = logging.Formatter(
         fmt="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
 
     handler = logging.StreamHandler(sys.stderr)
+    handler.set_name(_HANDLER_NAME)
     handler.setFormatter(formatter)
-
-    # Configure the root agentbench logger
-    logger = logging.getLogger("agentbench")
-    logger.setLevel(level)
     logger.addHandler(handler)
 
-    # Prevent propagation to root logger to avoid duplicate logs
-    logger.propagate = False
-
 
 def get_logger(name: str) -> logging.Logger:
     """
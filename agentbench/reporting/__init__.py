@@ -18,6 +18,7 @@ from agentbench.reporting.models import (
     ReportSummary,
 )
 from agentbench.reporting.summary import (
+    SummaryAccumulator,
     compute_summary,
     compute_overview,
     compute_failure_histogram,
@@ -40,6 +41,7 @@ __all__ = [
     "FailureBucket",
     "HardestTaskRow",
     "ReportSummary",
+    "SummaryAccumulator",
     "compute_summary",
     "compute_overview",
     "compute_failure_histogram",
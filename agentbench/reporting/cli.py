@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 import typer
@@ -25,23 +26,36 @@ def report_summary_cmd(
     ),
     overwrite: bool = typer.Option(False, "--overwrite", help="Overwrite existing files"),
     strict: bool = typer.Option(False, "--strict", help="Fail on malformed records"),
+    approx_percentiles_above: int | None = typer.Option(
+        None,
+        "--approx-percentiles-above",
+        min=1,
+        help="Estimate duration median/p95 (P-squared) once a run has more than N durations",
+    ),
 ):
     run_dir = Path(run_dir)
     out_dir = Path(out_dir) if out_dir else run_dir
 
     try:
-        inputs = load_run_dir(run_dir)
+        # Strict mode reports every bad line; otherwise repeats are folded.
+        inputs = load_run_dir(run_dir, compact_warnings=not strict)
     except FileNotFoundError as exc:
         raise typer.BadParameter(str(exc))
 
     if strict and inputs.warnings:
         messages = "; ".join(f"{w.code}:{w.message}" for w in inputs.warnings)
         raise typer.BadParameter(f"Strict mode: warnings present: {messages}")
-    summary = compute_summary(inputs.attempts)
-    summary.run_id = inputs.run_metadata.run_id
-    summary.suite = summary.suite or inputs.run_metadata.suite
-    summary.variant = summary.variant or inputs.run_metadata.variant
-    summary.warnings.extend(inputs.warnings)
+    summary = compute_summary(
+        inputs.attempts, streaming_threshold=approx_percentiles_above
+    )
+    summary = summary.model_copy(
+        update={
+            "run_id": inputs.run_metadata.run_id,
+            "suite": summary.suite or inputs.run_metadata.suite,
+            "variant": summary.variant or inputs.run_metadata.variant,
+            "warnings": summary.warnings + inputs.warnings,
+        }
+    )
 
     formats = {f.strip() for f in format.split(",") if f.strip()}
     outputs = default_output_paths(out_dir)
@@ -76,4 +90,13 @@ def _write_output(path: Path, content: str, overwrite: bool) -> None:
     if path.exists() and not overwrite:
         raise FileExistsError(f"{path} already exists. Use --overwrite to replace.")
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
+    # Write pre-encoded bytes to a sibling temp file and rename it into place,
+    # so a crash never leaves a truncated report behind.
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(content.encode("utf-8"))
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
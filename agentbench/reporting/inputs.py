@@ -1,5 +1,13 @@
+import mmap
+import os
+import sys
+from collections import Counter
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, Iterator
+
+from pydantic import TypeAdapter
+from pydantic_core import from_json
 
 from agentbench.reporting.models import (
     NormalizedAttempt,
@@ -8,6 +16,8 @@ from agentbench.reporting.models import (
     RunMetadata,
 )
 
+_ATTEMPT_ADAPTER = TypeAdapter(NormalizedAttempt)
+
 REQUIRED_FILES = ("run.json", "attempts.jsonl")
 OPTIONAL_FILES = (
     "events.jsonl",
@@ -24,7 +34,7 @@ def expected_paths(run_dir: Path) -> dict[str, Path]:
     return paths
 
 
-def load_run_dir(run_dir: Path) -> ReportInputs:
+def load_run_dir(run_dir: Path, compact_warnings: bool = False) -> ReportInputs:
     run_dir = Path(run_dir)
     paths = expected_paths(run_dir)
 
@@ -47,34 +57,41 @@ def load_run_dir(run_dir: Path) -> ReportInputs:
         raise FileNotFoundError(f"attempts.jsonl not found in {run_dir}")
 
     raw_attempts, attempt_warnings, invalid_lines = read_attempts_jsonl(
-        paths["attempts.jsonl"]
+        paths["attempts.jsonl"], compact_warnings=compact_warnings
     )
     warnings.extend(attempt_warnings)
 
-    attempts: list[NormalizedAttempt] = []
-    for raw in raw_attempts:
-        if not raw.get("task_id"):
-            warnings.append(
-                ReportWarning(
-                    code="missing_field",
-                    message="task_id is required",
-                    line_number=None,
-                    task_id=None,
+    # Normalize in one comprehension, then partition into attempts and
+    # warnings; records without a task_id are never normalized.
+    normalized_results = [
+        (raw, normalize_attempt(raw) if raw.get("task_id") else None)
+        for raw in raw_attempts
+    ]
+    attempts: list[NormalizedAttempt] = [
+        normalized for _, normalized in normalized_results if normalized is not None
+    ]
+    if len(attempts) < len(normalized_results):
+        for raw, normalized in normalized_results:
+            if normalized is not None:
+                continue
+            if not raw.get("task_id"):
+                warnings.append(
+                    ReportWarning.model_construct(
+                        code="missing_field",
+                        message="task_id is required",
+                        line_number=None,
+                        task_id=None,
+                    )
                 )
-            )
-            continue
-        normalized = normalize_attempt(raw)
-        if normalized is None:
-            warnings.append(
-                ReportWarning(
-                    code="invalid_record",
-                    message="record could not be normalized",
-                    line_number=None,
-                    task_id=raw.get("task_id"),
+            else:
+                warnings.append(
+                    ReportWarning(
+                        code="invalid_record",
+                        message="record could not be normalized",
+                        line_number=None,
+                        task_id=raw.get("task_id"),
+                    )
                 )
-            )
-            continue
-        attempts.append(normalized)
 
     run_metadata = RunMetadata(
         run_id=str(raw_run.get("run_id") or run_dir.name),
@@ -98,33 +115,54 @@ def read_run_metadata(run_json_path: Path) -> dict[str, Any]:
     run_json_path = Path(run_json_path)
     if not run_json_path.exists():
         raise FileNotFoundError(run_json_path)
-    import json
-
-    with run_json_path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    return from_json(run_json_path.read_bytes())
 
 
 def read_attempts_jsonl(
     attempts_path: Path,
+    compact_warnings: bool = False,
 ) -> tuple[list[dict[str, Any]], list[ReportWarning], int]:
+    """
+    Parse attempts.jsonl into raw records, warnings and an invalid-line count.
+
+    With compact_warnings, only the first bad line per warning code gets its
+    own ReportWarning; the rest are folded into one trailing summary warning.
+    """
     attempts_path = Path(attempts_path)
-    import json
 
     raw_attempts: list[dict[str, Any]] = []
     warnings: list[ReportWarning] = []
     invalid_lines = 0
 
-    with attempts_path.open("r", encoding="utf-8") as f:
-        for idx, line in enumerate(f, start=1):
+    # Lines are parsed as bytes by pydantic-core's JSON parser, skipping the
+    # text decode and the pure-Python json module. The file is memory-mapped
+    # so large runs are paged in on demand rather than copied up front.
+    with attempts_path.open("rb") as f, _map_file(f) as mm:
+        try:
+            # Clean files (the common case) parse in one tight comprehension.
+            return (
+                [from_json(line) for line in _iter_lines(mm) if line.strip()],
+                warnings,
+                invalid_lines,
+            )
+        except ValueError:
+            pass
+
+        # Re-parse line by line to report each bad line with its number.
+        suppressed: Counter[str] = Counter()
+        for idx, line in enumerate(_iter_lines(mm), start=1):
             line = line.strip()
             if not line:
                 continue
             try:
-                raw_attempts.append(json.loads(line))
-            except json.JSONDecodeError as exc:
+                raw_attempts.append(from_json(line))
+            except ValueError as exc:
                 invalid_lines += 1
+                if compact_warnings and invalid_lines > 1:
+                    suppressed["invalid_json"] += 1
+                    continue
                 warnings.append(
-                    ReportWarning(
+                    ReportWarning.model_construct(
                         code="invalid_json",
                         message=str(exc),
                         line_number=idx,
@@ -132,9 +170,37 @@ def read_attempts_jsonl(
                     )
                 )
 
+    for code, count in suppressed.items():
+        warnings.append(
+            ReportWarning.model_construct(
+                code=code,
+                message=f"{count} more lines with {code}",
+                line_number=None,
+                task_id=None,
+            )
+        )
+
     return raw_attempts, warnings, invalid_lines
 
 
+def _map_file(f: BinaryIO) -> mmap.mmap | nullcontext[bytes]:
+    # mmap refuses empty files; there is nothing to page in anyway.
+    if os.fstat(f.fileno()).st_size == 0:
+        return nullcontext(b"")
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _iter_lines(data: mmap.mmap | bytes) -> Iterator[bytes]:
+    start = 0
+    end = len(data)
+    while start < end:
+        newline = data.find(b"\n", start)
+        if newline == -1:
+            newline = end
+        yield data[start:newline]
+        start = newline + 1
+
+
 def normalize_attempt(raw: dict[str, Any]) -> NormalizedAttempt | None:
     task_id = raw.get("task_id")
     if not task_id:
@@ -145,20 +211,59 @@ def normalize_attempt(raw: dict[str, Any]) -> NormalizedAttempt | None:
 
     passed = bool(result.get("passed")) if "passed" in result else False
     failure_reason = result.get("failure_reason")
-    if isinstance(failure_reason, str):
-        failure_reason = failure_reason.lower()
-    elif failure_reason is not None:
-        failure_reason = str(failure_reason).lower()
-
-    return NormalizedAttempt(
-        task_id=task_id,
-        suite=raw.get("suite"),
-        variant=raw.get("variant"),
-        passed=passed,
-        exit_code=result.get("exit_code"),
-        failure_reason=failure_reason,
-        duration_sec=raw.get("duration_sec"),
-        steps_taken=result.get("steps_taken"),
-        artifact_paths=raw.get("artifact_paths") or {},
-        model_name=model.get("name"),
+    if failure_reason is not None:
+        if not isinstance(failure_reason, str):
+            failure_reason = str(failure_reason)
+        if not failure_reason.islower():
+            failure_reason = failure_reason.lower()
+        # A run has only a handful of distinct reasons; share one string each.
+        failure_reason = sys.intern(failure_reason)
+
+    suite = raw.get("suite")
+    variant = raw.get("variant")
+    exit_code = result.get("exit_code")
+    duration_sec = raw.get("duration_sec")
+    steps_taken = result.get("steps_taken")
+    artifact_paths = raw.get("artifact_paths") or {}
+    model_name = model.get("name")
+
+    # Records written by the harness already carry the model's types, so
+    # build them positionally without validation; anything else is
+    # validated (and coerced).
+    if (
+        isinstance(task_id, str)
+        and (suite is None or isinstance(suite, str))
+        and (variant is None or isinstance(variant, str))
+        and (model_name is None or isinstance(model_name, str))
+        and (exit_code is None or type(exit_code) is int)
+        and (steps_taken is None or type(steps_taken) is int)
+        and (duration_sec is None or type(duration_sec) is float)
+        and isinstance(artifact_paths, dict)
+        and all(isinstance(path, str) for path in artifact_paths.values())
+    ):
+        return NormalizedAttempt(
+            task_id,
+            passed,
+            suite,
+            variant,
+            exit_code,
+            failure_reason,
+            duration_sec,
+            steps_taken,
+            artifact_paths,
+            model_name,
+        )
+    return _ATTEMPT_ADAPTER.validate_python(
+        {
+            "task_id": task_id,
+            "suite": suite,
+            "variant": variant,
+            "passed": passed,
+            "exit_code": exit_code,
+            "failure_reason": failure_reason,
+            "duration_sec": duration_sec,
+            "steps_taken": steps_taken,
+            "artifact_paths": artifact_paths,
+            "model_name": model_name,
+        }
     )
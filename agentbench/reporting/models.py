@@ -1,3 +1,4 @@
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from pydantic import BaseModel, Field
@@ -19,16 +20,19 @@ class RunMetadata(BaseModel):
     task_count: int | None = None
 
 
-class NormalizedAttempt(BaseModel):
+@dataclass(slots=True)
+class NormalizedAttempt:
+    """One attempt row; a slotted dataclass since a report may hold many."""
+
     task_id: str
+    passed: bool
     suite: str | None = None
     variant: str | None = None
-    passed: bool
     exit_code: int | None = None
     failure_reason: str | None = None
     duration_sec: float | None = None
     steps_taken: int | None = None
-    artifact_paths: dict[str, str] = Field(default_factory=dict)
+    artifact_paths: dict[str, str] = field(default_factory=dict)
     model_name: str | None = None
 
 
@@ -0,0 +1,83 @@
+import heapq
+import math
+
+
+class P2Quantile:
+    """Streaming quantile estimate with the P-squared algorithm.
+
+    Jain & Chlamtac (1985): five markers track the minimum, the target
+    quantile, the maximum and two midpoints, adjusted with a piecewise
+    parabolic fit as samples arrive. State is O(1) regardless of sample
+    count; the result is an estimate once more than five samples are seen.
+    """
+
+    def __init__(self, q: float) -> None:
+        if not 0 < q < 1:
+            raise ValueError(f"q must be between 0 and 1, got {q}")
+        self.q = q
+        self.count = 0
+        self._heights: list[float] = []
+        self._positions = [1, 2, 3, 4, 5]
+        self._desired = [1.0, 1 + 2 * q, 1 + 4 * q, 3 + 2 * q, 5.0]
+        self._increments = [0.0, q / 2, q, (1 + q) / 2, 1.0]
+
+    def add(self, x: float) -> None:
+        self.count += 1
+        heights = self._heights
+        if self.count <= 5:
+            heights.append(x)
+            if self.count == 5:
+                heights.sort()
+            return
+
+        positions = self._positions
+        if x < heights[0]:
+            heights[0] = x
+            k = 0
+        elif x >= heights[4]:
+            heights[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= heights[k + 1]:
+                k += 1
+        for i in range(k + 1, 5):
+            positions[i] += 1
+        desired = self._desired
+        for i, step in enumerate(self._increments):
+            desired[i] += step
+
+        for i in (1, 2, 3):
+            d = desired[i] - positions[i]
+            if (d >= 1 and positions[i + 1] - positions[i] > 1) or (
+                d <= -1 and positions[i - 1] - positions[i] < -1
+            ):
+                sign = 1 if d > 0 else -1
+                height = self._parabolic(i, sign)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = self._linear(i, sign)
+                heights[i] = height
+                positions[i] += sign
+
+    def value(self) -> float | None:
+        """Current estimate, or None before any sample was added."""
+        if self.count == 0:
+            return None
+        if self.count <= 5:
+            # Too few samples for the markers; select the nearest rank.
+            rank = max(0, math.ceil(self.q * self.count) - 1)
+            return heapq.nsmallest(rank + 1, self._heights)[-1]
+        return self._heights[2]
+
+    def _parabolic(self, i: int, sign: int) -> float:
+        h = self._heights
+        n = self._positions
+        return h[i] + sign / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + sign) * (h[i + 1] - h[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - sign) * (h[i] - h[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def _linear(self, i: int, sign: int) -> float:
+        h = self._heights
+        n = self._positions
+        return h[i] + sign * (h[i + sign] - h[i]) / (n[i + sign] - n[i])
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import csv
 import io
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 
-from agentbench.reporting.models import NormalizedAttempt, ReportSummary
+from agentbench.reporting.models import NormalizedAttempt, ReportSummary, ReportWarning
 from agentbench.reporting.templates import (
     FAILURE_HEADER,
     HARDEST_HEADER,
@@ -47,10 +49,10 @@ def render_markdown(summary: ReportSummary) -> str:
     lines.append("| Failure Reason | Count | Percent |")
     lines.append("|----------------|-------|---------|")
     if summary.failure_histogram:
-        for bucket in summary.failure_histogram:
-            lines.append(
-                f"| {bucket.reason} | {bucket.count} | {format_percent(bucket.percent / 100, decimals=1)} |"
-            )
+        lines.extend(
+            f"| {bucket.reason} | {bucket.count} | {format_percent(bucket.percent / 100, decimals=1)} |"
+            for bucket in summary.failure_histogram
+        )
     else:
         lines.append("| (none) | 0 | 0.0% |")
     lines.append("")
@@ -60,17 +62,12 @@ def render_markdown(summary: ReportSummary) -> str:
     lines.append("| Task ID | Attempts | Failed | Avg Duration | Failure Reason | Artifact |")
     lines.append("|---------|----------|--------|--------------|----------------|----------|")
     if summary.hardest_tasks:
-        for row in summary.hardest_tasks:
-            lines.append(
-                "| {task_id} | {attempts} | {failed} | {avg_duration} | {failure_reason} | {artifact} |".format(
-                    task_id=row.task_id,
-                    attempts=row.attempts,
-                    failed=row.failed,
-                    avg_duration=format_duration(row.avg_duration),
-                    failure_reason=row.failure_reason or "",
-                    artifact=row.artifact_path or "",
-                )
-            )
+        fd = format_duration
+        lines.extend(
+            f"| {row.task_id} | {row.attempts} | {row.failed} | {fd(row.avg_duration)} "
+            f"| {row.failure_reason or ''} | {row.artifact_path or ''} |"
+            for row in summary.hardest_tasks
+        )
     else:
         lines.append("| (none) | 0 | 0 | 0.0s |  |  |")
     lines.append("")
@@ -78,19 +75,22 @@ def render_markdown(summary: ReportSummary) -> str:
     lines.append(WARNINGS_HEADER)
     lines.append("")
     if summary.warnings:
-        for warn in summary.warnings:
-            parts = [warn.code, warn.message]
-            if warn.task_id:
-                parts.append(f"task={warn.task_id}")
-            if warn.line_number is not None:
-                parts.append(f"line={warn.line_number}")
-            lines.append(f"- {' | '.join(parts)}")
+        lines.extend(_warning_line(warn) for warn in summary.warnings)
     else:
         lines.append("None")
 
     return "\n".join(lines)
 
 
+def _warning_line(warn: ReportWarning) -> str:
+    parts = [warn.code, warn.message]
+    if warn.task_id:
+        parts.append(f"task={warn.task_id}")
+    if warn.line_number is not None:
+        parts.append(f"line={warn.line_number}")
+    return f"- {' | '.join(parts)}"
+
+
 def render_summary_csv(summary: ReportSummary) -> str:
     headers = [
         "run_id",
@@ -147,35 +147,44 @@ def render_attempts_csv(
         "failing_stdout",
         "passing_stdout",
     ]
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow(headers)
-    attempts_sorted = sorted(attempts, key=lambda a: a.task_id)
+    lines = [",".join(headers)]
+    attempts_sorted = sorted(attempts, key=attrgetter("task_id"))
+    # Bound to locals: this loop runs once per attempt on large runs.
+    fmt_number = format_number
+    relpath = _safe_relpath
+    escape = _csv_escape
+    to_str = str
     for attempt in attempts_sorted:
         paths = attempt.artifact_paths or {}
         # Normalize artifact paths to be relative-safe strings
-        task_dir = _safe_relpath(paths.get("task_dir"))
-        failing_stdout = _safe_relpath(paths.get("failing_stdout"))
-        passing_stdout = _safe_relpath(paths.get("passing_stdout"))
-        writer.writerow(
-            [
-                run_id or "",
-                suite or attempt.suite or "",
-                variant or attempt.variant or "",
-                attempt.task_id,
-                str(bool(attempt.passed)).lower(),
-                attempt.failure_reason or "",
-                attempt.exit_code if attempt.exit_code is not None else "",
-                format_number(attempt.duration_sec),
-                attempt.steps_taken if attempt.steps_taken is not None else "",
-                "",
-                attempt.model_name or "",
-                task_dir or "",
-                failing_stdout or "",
-                passing_stdout or "",
-            ]
+        task_dir = relpath(paths.get("task_dir"))
+        failing_stdout = relpath(paths.get("failing_stdout"))
+        passing_stdout = relpath(paths.get("passing_stdout"))
+        duration = attempt.duration_sec
+        row = (
+            run_id or "",
+            suite or attempt.suite or "",
+            variant or attempt.variant or "",
+            attempt.task_id,
+            "true" if attempt.passed else "false",
+            attempt.failure_reason or "",
+            to_str(attempt.exit_code) if attempt.exit_code is not None else "",
+            # Floats (the common case) skip format_number's type dispatch.
+            f"{duration:.6f}".rstrip("0").rstrip(".")
+            if type(duration) is float
+            else fmt_number(duration),
+            to_str(attempt.steps_taken) if attempt.steps_taken is not None else "",
+            "",
+            attempt.model_name or "",
+            task_dir or "",
+            failing_stdout or "",
+            passing_stdout or "",
         )
-    return output.getvalue()
+        lines.append(",".join(map(escape, row)))
+    # Same output as csv.writer's defaults (minimal quoting, \r\n line ends)
+    # without its per-row dispatch.
+    lines.append("")
+    return "\r\n".join(lines)
 
 
 def default_output_paths(run_dir: Path) -> dict[str, Path]:
@@ -205,6 +214,14 @@ def format_number(value: float | int | None) -> str:
     return f"{value:.6f}".rstrip("0").rstrip(".")
 
 
+def _csv_escape(value: str) -> str:
+    if "," in value or '"' in value or "\n" in value or "\r" in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+# Attempts in a run repeat many of the same artifact paths.
+@lru_cache(maxsize=4096)
 def _safe_relpath(value: str | None) -> str | None:
     if not value:
         return None
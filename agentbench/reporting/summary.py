@@ -1,6 +1,7 @@
+import heapq
 import math
-from collections import Counter, defaultdict
-from statistics import median
+from collections import Counter
+from dataclasses import dataclass, field
 from typing import Iterable
 
 from agentbench.reporting.models import (
@@ -10,142 +11,270 @@ from agentbench.reporting.models import (
     OverviewMetrics,
     ReportSummary,
 )
+from agentbench.reporting.p2 import P2Quantile
 
 
-def compute_summary(attempts: list[NormalizedAttempt]) -> ReportSummary:
-    overview = compute_overview(attempts)
-    failures = compute_failure_histogram(attempts)
-    hardest = compute_hardest_tasks(attempts)
+class OverviewAccumulator:
+    """Running pass count and durations for compute_overview.
 
-    suites = sorted({a.suite for a in attempts if a.suite})
-    variants = sorted({a.variant for a in attempts if a.variant})
+    Durations are kept for an exact median and p95. With streaming_threshold
+    set, once more durations than that have been seen they are folded into
+    P-squared estimators and the buffer is dropped, bounding memory at the
+    cost of an approximate result.
+    """
 
-    return ReportSummary(
-        run_id=None,
-        suite=suites[0] if len(suites) == 1 else None,
-        variant=variants[0] if len(variants) == 1 else None,
-        overview=overview,
-        failure_histogram=failures,
-        hardest_tasks=hardest,
-        warnings=[],
-    )
+    def __init__(self, streaming_threshold: int | None = None) -> None:
+        self.total = 0
+        self.passed = 0
+        self.durations: list[float] = []
+        self.streaming_threshold = streaming_threshold
+        self._median: P2Quantile | None = None
+        self._p95: P2Quantile | None = None
 
+    def update(self, attempt: NormalizedAttempt) -> None:
+        self.total += 1
+        if attempt.passed:
+            self.passed += 1
+        duration = attempt.duration_sec
+        if duration is None:
+            return
+        if self._median is not None:
+            self._median.add(duration)
+            self._p95.add(duration)
+            return
+        self.durations.append(duration)
+        threshold = self.streaming_threshold
+        if threshold is not None and len(self.durations) > threshold:
+            self._start_streaming()
 
-def compute_overview(attempts: list[NormalizedAttempt]) -> OverviewMetrics:
-    total = len(attempts)
-    passed = sum(1 for a in attempts if a.passed)
-    failed = total - passed
-    pass_rate = (passed / total) if total else 0.0
+    def _start_streaming(self) -> None:
+        self._median = P2Quantile(0.5)
+        self._p95 = P2Quantile(0.95)
+        for duration in self.durations:
+            self._median.add(duration)
+            self._p95.add(duration)
+        self.durations = []
 
-    durations = [a.duration_sec for a in attempts if a.duration_sec is not None]
-    durations_sorted = sorted(durations)
+    def finalize(self) -> OverviewMetrics:
+        total = self.total
+        passed = self.passed
+        if self._median is not None:
+            duration_median = self._median.value()
+            duration_p95 = self._p95.value()
+        else:
+            durations = self.durations
+            # Sort once; both statistics index into the same sorted list.
+            durations.sort()
+            duration_median = _sorted_median(durations) if durations else None
+            duration_p95 = _sorted_percentile(durations, 95) if durations else None
+        return OverviewMetrics(
+            total_attempts=total,
+            passed=passed,
+            failed=total - passed,
+            pass_rate=(passed / total) if total else 0.0,
+            duration_median=duration_median,
+            duration_p95=duration_p95,
+        )
 
-    duration_median = median(durations_sorted) if durations_sorted else None
-    duration_p95 = _percentile(durations_sorted, 95) if durations_sorted else None
 
-    return OverviewMetrics(
-        total_attempts=total,
-        passed=passed,
-        failed=failed,
-        pass_rate=pass_rate,
-        duration_median=duration_median,
-        duration_p95=duration_p95,
-    )
+class FailureAccumulator:
+    """Running failure-reason counts for compute_failure_histogram."""
 
+    def __init__(self) -> None:
+        self.counts: Counter[str] = Counter()
+        self.total_failed = 0
 
-def compute_failure_histogram(
-    attempts: list[NormalizedAttempt],
-) -> list[FailureBucket]:
-    failed = [a for a in attempts if not a.passed]
-    if not failed:
-        return []
-
-    counts: Counter[str] = Counter()
-    for attempt in failed:
-        reason = attempt.failure_reason or "unknown"
-        counts[reason] += 1
-
-    total_failed = sum(counts.values())
-    buckets: list[FailureBucket] = []
-    for reason, count in counts.items():
-        percent = (count / total_failed) * 100 if total_failed else 0.0
-        buckets.append(
+    def update(self, attempt: NormalizedAttempt) -> None:
+        if not attempt.passed:
+            self.counts[attempt.failure_reason or "unknown"] += 1
+            self.total_failed += 1
+
+    def finalize(self) -> list[FailureBucket]:
+        total_failed = self.total_failed
+        # Sort the (reason, count) pairs once and build buckets in order.
+        ordered = sorted(self.counts.items(), key=lambda kv: (-kv[1], kv[0]))
+        return [
             FailureBucket(
                 reason=reason,
                 count=count,
-                percent=percent,
+                percent=(count / total_failed) * 100,
             )
-        )
+            for reason, count in ordered
+        ]
 
-    buckets.sort(key=lambda b: (-b.count, b.reason))
-    return buckets
 
+@dataclass(slots=True)
+class _TaskStats:
+    """Running per-task totals for HardestTasksAccumulator."""
 
-def compute_hardest_tasks(
-    attempts: list[NormalizedAttempt],
-    limit: int = 10,
-) -> list[HardestTaskRow]:
-    grouped: dict[str, list[NormalizedAttempt]] = defaultdict(list)
-    for attempt in attempts:
-        grouped[attempt.task_id].append(attempt)
-
-    rows: list[HardestTaskRow] = []
-    for task_id, task_attempts in grouped.items():
-        total = len(task_attempts)
-        passed = sum(1 for a in task_attempts if a.passed)
-        failed = total - passed
-        if total == 0:
-            continue
-        failure_rate = failed / total
-
-        durations = [a.duration_sec for a in task_attempts if a.duration_sec is not None]
-        avg_duration = sum(durations) / len(durations) if durations else None
-
-        failure_reasons = [
-            a.failure_reason or "unknown" for a in task_attempts if not a.passed
-        ]
-        failure_reason = None
-        if failure_reasons:
-            freq = Counter(failure_reasons)
-            top_count = max(freq.values())
-            candidates = [r for r, c in freq.items() if c == top_count]
-            failure_reason = sorted(candidates)[0]
-
-        artifact_path = None
-        for a in task_attempts:
-            if a.artifact_paths:
-                artifact_path = a.artifact_paths.get("task_dir")
-                if artifact_path:
-                    break
-
-        rows.append(
+    total: int = 0
+    passed: int = 0
+    duration_sum: float = 0.0
+    duration_count: int = 0
+    reasons: dict[str, int] = field(default_factory=dict)
+    # Most frequent failure reason so far, ties going to the smallest name.
+    best_reason: str | None = None
+    best_count: int = 0
+    artifact_path: str | None = None
+
+
+class HardestTasksAccumulator:
+    """Running per-task totals for compute_hardest_tasks.
+
+    Memory grows with the number of distinct tasks, not attempts.
+    """
+
+    def __init__(self) -> None:
+        self.stats: dict[str, _TaskStats] = {}
+
+    def update(self, attempt: NormalizedAttempt) -> None:
+        task = self.stats.get(attempt.task_id)
+        if task is None:
+            task = self.stats[attempt.task_id] = _TaskStats()
+        task.total += 1
+        if attempt.passed:
+            task.passed += 1
+        else:
+            reason = attempt.failure_reason or "unknown"
+            count = task.reasons[reason] = task.reasons.get(reason, 0) + 1
+            if count > task.best_count or (
+                count == task.best_count and reason < task.best_reason
+            ):
+                task.best_count = count
+                task.best_reason = reason
+        duration = attempt.duration_sec
+        if duration is not None:
+            task.duration_sum += duration
+            task.duration_count += 1
+        if not task.artifact_path and attempt.artifact_paths:
+            task.artifact_path = attempt.artifact_paths.get("task_dir")
+
+    def finalize(self, limit: int = 10) -> list[HardestTaskRow]:
+        # Only the top `limit` tasks are returned, so pick them with a bounded
+        # heap and build rows for those alone.
+        hardest = heapq.nsmallest(limit, self.stats.items(), key=_hardness_key)
+        return [
             HardestTaskRow(
                 task_id=task_id,
-                failure_reason=failure_reason,
-                attempts=total,
-                passed=passed,
-                failed=failed,
-                avg_duration=avg_duration,
-                artifact_path=artifact_path,
+                failure_reason=task.best_reason,
+                attempts=task.total,
+                passed=task.passed,
+                failed=task.total - task.passed,
+                avg_duration=(
+                    task.duration_sum / task.duration_count
+                    if task.duration_count
+                    else None
+                ),
+                artifact_path=task.artifact_path,
             )
-        )
+            for task_id, task in hardest
+        ]
 
-    rows.sort(
-        key=lambda r: (
-            -(r.failed / r.attempts if r.attempts else 0),
-            -(r.avg_duration or 0.0),
-            r.task_id,
-        )
+
+def _hardness_key(item: tuple[str, _TaskStats]) -> tuple[float, float, str]:
+    """Highest failure rate first, then slowest average, then task_id."""
+    task_id, task = item
+    avg_duration = (
+        task.duration_sum / task.duration_count if task.duration_count else 0.0
     )
-    return rows[:limit]
+    failure_rate = (task.total - task.passed) / task.total
+    return (-failure_rate, -avg_duration, task_id)
+
+
+class SummaryAccumulator:
+    """Feed attempts one at a time and build a ReportSummary at the end.
 
+    Attempts can be streamed in; none of them are retained. See
+    OverviewAccumulator for streaming_threshold.
+    """
 
-def _percentile(values: Iterable[float], q: int) -> float | None:
-    vals = list(values)
-    if not vals:
-        return None
-    vals.sort()
-    n = len(vals)
+    def __init__(self, streaming_threshold: int | None = None) -> None:
+        self.overview = OverviewAccumulator(streaming_threshold)
+        self.failures = FailureAccumulator()
+        self.hardest = HardestTasksAccumulator()
+        # First suite/variant seen, and whether any later attempt differed.
+        self.suite: str | None = None
+        self.suite_mixed = False
+        self.variant: str | None = None
+        self.variant_mixed = False
+
+    def update(self, attempt: NormalizedAttempt) -> None:
+        self.overview.update(attempt)
+        self.failures.update(attempt)
+        self.hardest.update(attempt)
+        suite = attempt.suite
+        if suite and not self.suite_mixed:
+            if self.suite is None:
+                self.suite = suite
+            elif suite != self.suite:
+                self.suite_mixed = True
+        variant = attempt.variant
+        if variant and not self.variant_mixed:
+            if self.variant is None:
+                self.variant = variant
+            elif variant != self.variant:
+                self.variant_mixed = True
+
+    def finalize(self) -> ReportSummary:
+        return ReportSummary(
+            run_id=None,
+            suite=None if self.suite_mixed else self.suite,
+            variant=None if self.variant_mixed else self.variant,
+            overview=self.overview.finalize(),
+            failure_histogram=self.failures.finalize(),
+            hardest_tasks=self.hardest.finalize(),
+            warnings=[],
+        )
+
+
+def compute_summary(
+    attempts: Iterable[NormalizedAttempt],
+    streaming_threshold: int | None = None,
+) -> ReportSummary:
+    acc = SummaryAccumulator(streaming_threshold)
+    update = acc.update
+    for attempt in attempts:
+        update(attempt)
+    return acc.finalize()
+
+
+def compute_overview(attempts: Iterable[NormalizedAttempt]) -> OverviewMetrics:
+    acc = OverviewAccumulator()
+    for attempt in attempts:
+        acc.update(attempt)
+    return acc.finalize()
+
+
+def compute_failure_histogram(
+    attempts: Iterable[NormalizedAttempt],
+) -> list[FailureBucket]:
+    acc = FailureAccumulator()
+    for attempt in attempts:
+        acc.update(attempt)
+    return acc.finalize()
+
+
+def compute_hardest_tasks(
+    attempts: Iterable[NormalizedAttempt],
+    limit: int = 10,
+) -> list[HardestTaskRow]:
+    acc = HardestTasksAccumulator()
+    for attempt in attempts:
+        acc.update(attempt)
+    return acc.finalize(limit)
+
+
+def _sorted_percentile(sorted_values: list[float], q: int) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty list."""
+    n = len(sorted_values)
     rank = math.ceil(q / 100 * n) - 1
     rank = max(0, min(rank, n - 1))
-    return vals[rank]
+    return sorted_values[rank]
+
+
+def _sorted_median(sorted_values: list[float]) -> float:
+    """Median of an already sorted, non-empty list (same as statistics.median)."""
+    mid = len(sorted_values) // 2
+    if len(sorted_values) % 2:
+        return sorted_values[mid]
+    return (sorted_values[mid - 1] + sorted_values[mid]) / 2
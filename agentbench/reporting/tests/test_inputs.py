@@ -1,9 +1,11 @@
+from dataclasses import asdict
 from pathlib import Path
 import json
 
 import pytest
 
 from agentbench.reporting.inputs import (
+    _ATTEMPT_ADAPTER,
     load_run_dir,
     normalize_attempt,
     read_attempts_jsonl,
@@ -32,6 +34,26 @@ def test_normalize_missing_task_id_skipped():
     assert normalize_attempt(raw) is None
 
 
+def test_normalize_trusted_record_matches_validated_model():
+    raw = {
+        "task_id": "t1",
+        "suite": "s1",
+        "duration_sec": 1.5,
+        "artifact_paths": {"logs": "logs/"},
+        "result": {"passed": False, "exit_code": 1, "steps_taken": 4},
+        "model": {"name": "m"},
+    }
+    normalized = normalize_attempt(raw)
+    assert normalized == _ATTEMPT_ADAPTER.validate_python(asdict(normalized))
+
+
+def test_normalize_coerces_loose_types():
+    raw = {"task_id": "t1", "duration_sec": 3, "result": {"passed": True, "exit_code": "0"}}
+    normalized = normalize_attempt(raw)
+    assert normalized.duration_sec == 3.0 and isinstance(normalized.duration_sec, float)
+    assert normalized.exit_code == 0
+
+
 def test_read_attempts_invalid_json(tmp_path: Path):
     attempts_path = tmp_path / "attempts.jsonl"
     with attempts_path.open("w", encoding="utf-8") as f:
@@ -43,6 +65,17 @@ def test_read_attempts_invalid_json(tmp_path: Path):
     assert any(w.code == "invalid_json" for w in warnings)
 
 
+def test_read_attempts_undecodable_line_is_reported(tmp_path: Path):
+    attempts_path = tmp_path / "attempts.jsonl"
+    attempts_path.write_bytes(b'{"task_id": "t1"}\n{"task_id": "\xff"}\n{"task_id": "t3"}\n')
+
+    raw_attempts, warnings, invalid = read_attempts_jsonl(attempts_path)
+
+    assert [raw["task_id"] for raw in raw_attempts] == ["t1", "t3"]
+    assert invalid == 1
+    assert warnings[0].line_number == 2
+
+
 def test_load_run_dir_success(tmp_path: Path):
     run_dir = tmp_path / "run"
     run_dir.mkdir()
@@ -96,3 +129,67 @@ def test_missing_attempts_jsonl_raises(tmp_path: Path):
     run_dir.mkdir()
     with pytest.raises(FileNotFoundError):
         load_run_dir(run_dir)
+
+
+def test_normalized_attempt_has_no_instance_dict():
+    normalized = normalize_attempt({"task_id": "t1", "result": {"passed": True}})
+    assert not hasattr(normalized, "__dict__")
+
+
+def test_read_attempts_compact_warnings_folds_repeats(tmp_path: Path):
+    attempts_path = tmp_path / "attempts.jsonl"
+    attempts_path.write_text('{"task_id": "t1"}\n{bad\n{bad\n{bad\n', encoding="utf-8")
+
+    raw_attempts, warnings, invalid = read_attempts_jsonl(
+        attempts_path, compact_warnings=True
+    )
+
+    assert len(raw_attempts) == 1
+    assert invalid == 3
+    assert [w.line_number for w in warnings] == [2, None]
+    assert warnings[1].message == "2 more lines with invalid_json"
+
+
+def test_read_attempts_empty_file(tmp_path: Path):
+    attempts_path = tmp_path / "attempts.jsonl"
+    attempts_path.write_bytes(b"")
+
+    assert read_attempts_jsonl(attempts_path) == ([], [], 0)
+
+
+def test_read_attempts_without_trailing_newline(tmp_path: Path):
+    attempts_path = tmp_path / "attempts.jsonl"
+    attempts_path.write_bytes(b'{"task_id": "t1"}\n\n{"task_id": "t2"}')
+
+    raw_attempts, _, _ = read_attempts_jsonl(attempts_path)
+
+    assert [raw["task_id"] for raw in raw_attempts] == ["t1", "t2"]
+
+
+def test_normalize_trusted_record_fills_fields_by_name():
+    raw = {
+        "task_id": "t1",
+        "suite": "s1",
+        "variant": "v1",
+        "duration_sec": 2.5,
+        "artifact_paths": {"task_dir": "tasks/t1"},
+        "result": {
+            "passed": False,
+            "exit_code": 2,
+            "failure_reason": "timeout",
+            "steps_taken": 7,
+        },
+        "model": {"name": "m"},
+    }
+    assert normalize_attempt(raw) == NormalizedAttempt(
+        task_id="t1",
+        passed=False,
+        suite="s1",
+        variant="v1",
+        exit_code=2,
+        failure_reason="timeout",
+        duration_sec=2.5,
+        steps_taken=7,
+        artifact_paths={"task_dir": "tasks/t1"},
+        model_name="m",
+    )
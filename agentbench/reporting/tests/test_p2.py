@@ -0,0 +1,49 @@
+import random
+
+import pytest
+
+from agentbench.reporting.models import NormalizedAttempt
+from agentbench.reporting.p2 import P2Quantile
+from agentbench.reporting.summary import OverviewAccumulator, compute_overview
+
+
+def test_p2_small_samples_use_nearest_rank():
+    estimator = P2Quantile(0.95)
+    assert estimator.value() is None
+    for x in (3.0, 1.0, 2.0):
+        estimator.add(x)
+    assert estimator.value() == 3.0
+
+
+def test_p2_tracks_quantiles_of_a_large_stream():
+    rng = random.Random(7)
+    samples = [rng.uniform(0, 100) for _ in range(20_000)]
+    median = P2Quantile(0.5)
+    p95 = P2Quantile(0.95)
+    for x in samples:
+        median.add(x)
+        p95.add(x)
+    assert median.value() == pytest.approx(50, abs=2)
+    assert p95.value() == pytest.approx(95, abs=2)
+
+
+def test_p2_rejects_out_of_range_quantile():
+    with pytest.raises(ValueError):
+        P2Quantile(1.0)
+
+
+def test_overview_switches_to_estimates_past_threshold():
+    attempts = [
+        NormalizedAttempt(task_id=f"t{i}", passed=True, duration_sec=float(i % 100))
+        for i in range(5_000)
+    ]
+    acc = OverviewAccumulator(streaming_threshold=100)
+    for attempt in attempts:
+        acc.update(attempt)
+    overview = acc.finalize()
+
+    assert acc.durations == []
+    exact = compute_overview(attempts)
+    assert overview.total_attempts == exact.total_attempts
+    assert overview.duration_median == pytest.approx(exact.duration_median, abs=3)
+    assert overview.duration_p95 == pytest.approx(exact.duration_p95, abs=3)
@@ -1,3 +1,6 @@
+import csv
+import io
+
 from agentbench.reporting.models import (
     FailureBucket,
     HardestTaskRow,
@@ -7,6 +10,7 @@ from agentbench.reporting.models import (
     ReportWarning,
 )
 from agentbench.reporting.render import (
+    _safe_relpath,
     default_output_paths,
     render_attempts_csv,
     render_markdown,
@@ -120,6 +124,29 @@ def test_attempts_csv_header_and_ordering():
     assert rows[2].split(",")[11] == "abs/path/b"
 
 
+def test_attempts_csv_matches_csv_module_quoting():
+    attempts = [
+        NormalizedAttempt(
+            task_id="task,1",
+            passed=False,
+            failure_reason='said "no"\nthen stopped',
+            exit_code=2,
+            duration_sec=1.25,
+            artifact_paths={"task_dir": "/runs/task,1/"},
+        )
+    ]
+    rendered = render_attempts_csv(attempts, run_id="r1", suite="s", variant="v")
+
+    rows = list(csv.reader(io.StringIO(rendered, newline="")))
+    expected = io.StringIO()
+    csv.writer(expected).writerows(rows)
+
+    assert rendered == expected.getvalue()
+    assert rows[1][3] == "task,1"
+    assert rows[1][5] == 'said "no"\nthen stopped'
+    assert rows[1][11] == "runs/task,1/"
+
+
 def test_default_output_paths_names(tmp_path):
     paths = default_output_paths(tmp_path)
     assert paths["markdown"].name == "report_summary.md"
@@ -135,3 +162,10 @@ def test_render_deterministic():
     csv1 = render_summary_csv(summary)
     csv2 = render_summary_csv(summary)
     assert csv1 == csv2
+
+
+def test_safe_relpath_strips_leading_separators():
+    assert _safe_relpath("/abs/task") == "abs/task"
+    assert _safe_relpath("\\win\\task") == "win\\task"
+    assert _safe_relpath("rel/task") == "rel/task"
+    assert _safe_relpath(None) is None
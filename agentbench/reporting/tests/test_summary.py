@@ -1,5 +1,6 @@
 from agentbench.reporting.models import NormalizedAttempt
 from agentbench.reporting.summary import (
+    _sorted_percentile,
     compute_failure_histogram,
     compute_hardest_tasks,
     compute_overview,
@@ -38,6 +39,20 @@ def test_compute_overview_counts_and_rate():
     assert ov.duration_p95 == 15.0
 
 
+def test_compute_overview_matches_statistics_on_unsorted_durations():
+    from statistics import median
+
+    durations = [7.0, 1.0, 9.5, 3.0, 3.0, 12.0, 0.5]
+    attempts = [make_attempt(task_id=f"t{i}", duration_sec=d) for i, d in enumerate(durations)]
+    attempts.append(make_attempt(task_id="none", duration_sec=None))
+
+    ov = compute_overview(attempts)
+
+    assert ov.duration_median == median(durations)
+    assert ov.duration_p95 == 12.0
+    assert compute_overview(attempts[:2]).duration_median == median(durations[:2])
+
+
 def test_compute_failure_histogram_sorted():
     attempts = [
         make_attempt(task_id="a", passed=False, failure_reason="timeout"),
@@ -89,3 +104,19 @@ def test_failure_histogram_tiebreak_reason_sort():
     ]
     buckets = compute_failure_histogram(attempts)
     assert [b.reason for b in buckets] == ["a_reason", "b_reason"]
+
+
+def test_sorted_percentile_uses_nearest_rank():
+    values = sorted([5.0, 1.0, 4.0, 2.0, 3.0, 9.0, 7.0])
+    assert _sorted_percentile(values, 0) == 1.0
+    assert _sorted_percentile(values, 50) == 4.0
+    assert _sorted_percentile(values, 95) == 9.0
+    assert _sorted_percentile(values, 100) == 9.0
+
+
+def test_compute_summary_accepts_a_stream():
+    attempts = [
+        make_attempt(task_id="t1", passed=True, duration_sec=1.0),
+        make_attempt(task_id="t2", passed=False, failure_reason="timeout"),
+    ]
+    assert compute_summary(iter(attempts)) == compute_summary(attempts)
@@ -1,4 +1,5 @@
 import logging
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
@@ -17,8 +18,18 @@ def load_task(task_yaml: Path) -> TaskSpec:
     - Validate against schema (reuse validation logic from `run_task.py`)
     - Return `TaskSpec` object
     - Raise `InvalidTaskError` if validation fails
+
+    Parsed specs are cached by path, mtime and size, so editing the file
+    invalidates its entry. Each call returns a fresh copy of the cached spec.
     """
 
+    stat = task_yaml.stat()
+    task_spec = _load_task_cached(task_yaml, stat.st_mtime_ns, stat.st_size)
+    return task_spec.model_copy(deep=True)
+
+
+@lru_cache(maxsize=512)
+def _load_task_cached(task_yaml: Path, _mtime_ns: int, _size: int) -> TaskSpec:
     with open(task_yaml) as f:
         task = yaml.safe_load(f)
 
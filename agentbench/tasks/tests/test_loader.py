@@ -278,6 +278,29 @@ def test_load_task(temp_task_dir: Path, valid_task_yaml_content: dict):
     assert loaded_task.source_path == temp_task_dir
 
 
+def test_load_task_returns_independent_copies(temp_task_dir: Path):
+    """Repeated loads share the parse but never share mutable state."""
+    first = load_task(temp_task_dir)
+    first.setup.commands.append("echo mutated")
+
+    second = load_task(temp_task_dir)
+
+    assert second is not first
+    assert "echo mutated" not in second.setup.commands
+
+
+def test_load_task_picks_up_file_edits(
+    temp_task_dir: Path, valid_task_yaml_content: dict
+):
+    """Editing task.yaml invalidates the cached spec."""
+    assert load_task(temp_task_dir).id == valid_task_yaml_content["id"]
+
+    edited = dict(valid_task_yaml_content, id="edited-task-id")
+    temp_task_dir.write_text(yaml.safe_dump(edited))
+
+    assert load_task(temp_task_dir).id == "edited-task-id"
+
+
 # TODO: Test `load_task()` raises `InvalidTaskError` for malformed YAML
 def test_load_task_malformed_yaml(temp_malformed_task_dir: Path):
     """Test that load_task() raises an error for malformed YAML."""
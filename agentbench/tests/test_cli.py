@@ -1,11 +1,22 @@
 """Unit tests for CLI commands using typer.testing.CliRunner."""
 
+import sqlite3
+from datetime import UTC, datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
 from typer.testing import CliRunner
 
-from agentbench.cli import app
+from agentbench.cli import _load_suite_checkpoint, app
+from agentbench.schemas.attempt_record import (
+    AttemptRecord,
+    BaselineValidationResult,
+    LimitsConfig,
+    ModelConfig,
+    TaskResult,
+    TimestampInfo,
+)
 
 runner = CliRunner()
 
@@ -181,6 +192,328 @@ class TestListTasksCommand:
         assert "Error" in result.output
 
 
+def _fake_suite_tasks(*task_ids: str) -> list[MagicMock]:
+    tasks = []
+    for task_id in task_ids:
+        task = MagicMock()
+        task.id = task_id
+        tasks.append(task)
+    return tasks
+
+
+def _fake_attempt(task, variant="scripted", **_kwargs) -> AttemptRecord:
+    now = datetime(2025, 1, 1, tzinfo=UTC)
+    return AttemptRecord(
+        run_id="01TESTRUN",
+        task_id=task.id,
+        suite="demo",
+        task_spec_version="1.0",
+        harness_min_version="0.1.0",
+        labels=[],
+        timestamps=TimestampInfo(started_at=now, ended_at=now),
+        duration_sec=0.0,
+        baseline_validation=BaselineValidationResult(attempted=True, failed_as_expected=True, exit_code=1),
+        result=TaskResult(passed=True, exit_code=0, failure_reason=None),
+        artifact_paths={},
+        variant=variant,
+        model=None,
+        limits=LimitsConfig(timeout_sec=600, tool_timeout_sec=None),
+        schema_version="0.1.0",
+    )
+
+
+class TestRunAgentSuiteCommand:
+    """Tests for the run-agent-suite CLI command."""
+
+    @patch("agentbench.cli.print_agent_summary")
+    @patch("agentbench.agent_runner.run_agent_attempt")
+    @patch("agentbench.cli.load_suite")
+    def test_concurrent_run_keeps_suite_order_in_summary(
+        self, mock_load_suite, mock_run_attempt, _mock_summary, tmp_path: Path
+    ):
+        """run-agent-suite --concurrency runs every task and reports in suite order."""
+        mock_load_suite.return_value = _fake_suite_tasks("alpha", "beta", "gamma")
+        mock_run_attempt.side_effect = _fake_attempt
+
+        result = runner.invoke(
+            app,
+            [
+                "run-agent-suite",
+                "demo",
+                "--tasks-root",
+                str(tmp_path),
+                "--out",
+                str(tmp_path / "out"),
+                "--variant",
+                "scripted",
+                "--concurrency",
+                "3",
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert mock_run_attempt.call_count == 3
+        table = result.output[result.output.index("Suite Run Summary") :]
+        assert table.index("alpha") < table.index("beta") < table.index("gamma")
+
+    @patch("agentbench.cli.print_agent_summary")
+    @patch("agentbench.agent_runner.run_agent_attempt")
+    @patch("agentbench.cli.load_suite")
+    def test_concurrent_run_drives_agent_loops_in_worker_threads(
+        self, mock_load_suite, mock_run_attempt, _mock_summary, tmp_path: Path, monkeypatch
+    ):
+        """AgentLoop.run() works off the main thread, where SIGINT handlers can't be set."""
+        from agentbench.agents.loop import AgentLoop
+        from agentbench.agents.types import AgentResult, StopReason
+
+        def _succeed(self, started_at):
+            return AgentResult(
+                success=True,
+                stop_reason=StopReason.SUCCESS,
+                steps_taken=0,
+                patches_applied=[],
+                duration_sec=0.0,
+                final_test_exit_code=0,
+                final_test_passed=True,
+            )
+
+        def _attempt_with_loop(task, workspace_dir, artifacts_dir, **kwargs):
+            loop = AgentLoop(
+                agent=MagicMock(),
+                task=task,
+                workspace_root=workspace_dir,
+                artifacts_dir=artifacts_dir,
+                sandbox=MagicMock(),
+                event_logger=MagicMock(),
+            )
+            result = loop.run()
+            assert result.stop_reason == StopReason.SUCCESS
+            return _fake_attempt(task, **kwargs)
+
+        monkeypatch.setattr(AgentLoop, "_run_main", _succeed)
+        mock_load_suite.return_value = _fake_suite_tasks("alpha", "beta", "gamma")
+        mock_run_attempt.side_effect = _attempt_with_loop
+
+        result = runner.invoke(
+            app,
+            [
+                "run-agent-suite",
+                "demo",
+                "--tasks-root",
+                str(tmp_path),
+                "--out",
+                str(tmp_path / "out"),
+                "--concurrency",
+                "3",
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert mock_run_attempt.call_count == 3
+
+    @patch("agentbench.cli.print_agent_summary")
+    @patch("agentbench.agent_runner.run_agent_attempt")
+    @patch("agentbench.cli.load_suite")
+    def test_quiet_skips_per_task_output(
+        self, mock_load_suite, mock_run_attempt, mock_summary, tmp_path: Path
+    ):
+        """run-agent-suite --quiet prints only the suite table."""
+        mock_load_suite.return_value = _fake_suite_tasks("alpha", "beta")
+        mock_run_attempt.side_effect = _fake_attempt
+
+        result = runner.invoke(
+            app,
+            [
+                "run-agent-suite",
+                "demo",
+                "--tasks-root",
+                str(tmp_path),
+                "--out",
+                str(tmp_path / "out"),
+                "--quiet",
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        mock_summary.assert_not_called()
+        assert "Running agent" not in result.output
+        assert "Suite Run Summary" in result.output
+
+    @patch("agentbench.cli.print_agent_summary")
+    @patch("agentbench.agent_runner.run_agent_attempt")
+    @patch("agentbench.cli.load_suite")
+    def test_rerun_resumes_from_checkpoint(
+        self, mock_load_suite, mock_run_attempt, _mock_summary, tmp_path: Path
+    ):
+        """A second run skips tasks recorded in completed.jsonl unless --no-resume."""
+        mock_load_suite.return_value = _fake_suite_tasks("alpha", "beta")
+        mock_run_attempt.side_effect = _fake_attempt
+        args = [
+            "run-agent-suite",
+            "demo",
+            "--tasks-root",
+            str(tmp_path),
+            "--out",
+            str(tmp_path / "out"),
+            "--variant",
+            "scripted",
+        ]
+
+        first = runner.invoke(app, args)
+        assert first.exit_code == 0, first.output
+        assert mock_run_attempt.call_count == 2
+        assert (tmp_path / "out" / "suite_runs" / "demo" / "completed.jsonl").exists()
+
+        mock_run_attempt.reset_mock()
+        resumed = runner.invoke(app, args)
+        assert resumed.exit_code == 0, resumed.output
+        mock_run_attempt.assert_not_called()
+        assert "Resuming: skipping 2 task(s)" in resumed.output
+        table = resumed.output[resumed.output.index("Suite Run Summary") :]
+        assert "alpha" in table and "beta" in table
+
+        rerun = runner.invoke(app, [*args, "--no-resume"])
+        assert rerun.exit_code == 0, rerun.output
+        assert mock_run_attempt.call_count == 2
+
+    @patch("agentbench.agent_runner.run_agent_attempt")
+    @patch("agentbench.cli.load_suite")
+    def test_rejected_api_key_fails_before_any_task(
+        self, mock_load_suite, mock_run_attempt, tmp_path: Path, monkeypatch
+    ):
+        """run-agent-suite aborts on a rejected key without touching workspaces."""
+        from agentbench.llm.errors import AuthenticationError
+        from agentbench.llm.openrouter import OpenRouterClient
+
+        async def reject(self):
+            raise AuthenticationError("OpenRouter rejected the API key (HTTP 401)")
+
+        monkeypatch.setenv("OPENROUTER_API_KEY", "bad-key")
+        monkeypatch.setattr(OpenRouterClient, "verify_auth", reject)
+        mock_load_suite.return_value = _fake_suite_tasks("alpha")
+        out_dir = tmp_path / "out"
+
+        result = runner.invoke(
+            app,
+            [
+                "run-agent-suite",
+                "demo",
+                "--tasks-root",
+                str(tmp_path),
+                "--out",
+                str(out_dir),
+                "--variant",
+                "llm_v0",
+            ],
+        )
+
+        assert result.exit_code == 1
+        assert "rejected the API key" in result.output
+        mock_run_attempt.assert_not_called()
+        assert not (out_dir / "suite_runs").exists()
+
+    @patch("agentbench.cli.print_agent_summary")
+    @patch("agentbench.agent_runner.run_agent_attempt")
+    @patch("agentbench.cli.load_suite")
+    def test_llm_response_cache_is_closed_after_run(
+        self, mock_load_suite, mock_run_attempt, _mock_summary, tmp_path: Path, monkeypatch
+    ):
+        """run-agent-suite closes the response cache's sqlite connection on exit."""
+        from agentbench.llm.cache import ResponseCache
+        from agentbench.llm.openrouter import OpenRouterClient
+
+        async def accept(self):
+            return None
+
+        caches: list[ResponseCache] = []
+
+        def _attempt(task, llm_client=None, **kwargs):
+            caches.append(llm_client.response_cache)
+            return _fake_attempt(task, **kwargs)
+
+        monkeypatch.setenv("OPENROUTER_API_KEY", "test-key")
+        monkeypatch.setattr(OpenRouterClient, "verify_auth", accept)
+        mock_load_suite.return_value = _fake_suite_tasks("alpha")
+        mock_run_attempt.side_effect = _attempt
+
+        result = runner.invoke(
+            app,
+            [
+                "run-agent-suite",
+                "demo",
+                "--tasks-root",
+                str(tmp_path),
+                "--out",
+                str(tmp_path / "out"),
+                "--variant",
+                "llm_v0",
+                "--llm-cache",
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert len(caches) == 1
+        with pytest.raises(sqlite3.ProgrammingError):
+            caches[0].get("any-key")
+
+
+class TestLoadSuiteCheckpoint:
+    """Tests for reading the run-agent-suite resume checkpoint."""
+
+    def test_matches_model_and_skips_infra_failures(self, tmp_path: Path):
+        checkpoint = tmp_path / "completed.jsonl"
+        model = ModelConfig(
+            provider="openrouter",
+            name="model-a",
+            temperature=0.0,
+            top_p=1.0,
+            max_tokens=4096,
+            prompt_version=None,
+        )
+        done = _fake_attempt(_fake_suite_tasks("alpha")[0], variant="llm_v0")
+        done.model = model
+        other_model = _fake_attempt(_fake_suite_tasks("beta")[0], variant="llm_v0")
+        other_model.model = model.model_copy(update={"name": "model-b"})
+        crashed = _fake_attempt(_fake_suite_tasks("gamma")[0], variant="llm_v0")
+        crashed.model = model
+        crashed.result = TaskResult(passed=False, exit_code=-1, failure_reason="UNKNOWN")
+        checkpoint.write_text(
+            "".join(r.model_dump_json() + "\n" for r in (done, other_model, crashed)),
+            encoding="utf-8",
+        )
+
+        completed = _load_suite_checkpoint(checkpoint, "llm_v0", "model-a")
+
+        assert list(completed) == ["alpha"]
+
+
+class TestPrintSuiteSummary:
+    """Tests for the suite summary renderer."""
+
+    def test_small_suite_renders_rich_table(self):
+        from agentbench.cli import console, print_suite_summary
+
+        with console.capture() as capture:
+            print_suite_summary("demo", [("task-1", "✓", "0", "SUCCESS", "")])
+
+        assert "Suite Run Summary: demo" in capture.get()
+        assert "┃" in capture.get()
+
+    def test_large_suite_renders_aligned_plain_text(self):
+        from agentbench.cli import console, print_suite_summary
+
+        rows = [(f"task-{i}", "✗", "1", "MAX_STEPS", "AGENT_GAVE_UP") for i in range(150)]
+        with console.capture() as capture:
+            print_suite_summary("big", rows)
+
+        lines = capture.get().splitlines()
+        assert lines[0] == "Suite Run Summary: big"
+        assert lines[1].split() == ["Task", "Success", "Exit", "Stop", "Reason", "Failure", "Reason"]
+        assert len(lines) == 152
+        assert "┃" not in capture.get()
+        assert lines[2].index("✗") == lines[1].index("Success")
+
+
 class TestMainCallback:
     """Tests for the main CLI callback."""
 
@@ -199,3 +532,62 @@ class TestMainCallback:
         result = runner.invoke(app, ["--help"])
         assert result.exit_code == 0
         assert "AgentBench" in result.stdout
+
+
+class TestFastRmtree:
+    """Tests for the workspace cleanup helper."""
+
+    def test_removes_nested_tree(self, tmp_path: Path):
+        from agentbench.cli import _fast_rmtree
+
+        root = tmp_path / "workspace"
+        (root / "repo" / "pkg").mkdir(parents=True)
+        (root / "repo" / "pkg" / "mod.py").write_text("x = 1\n")
+        (root / "notes.txt").write_text("hello")
+
+        _fast_rmtree(root)
+
+        assert not root.exists()
+
+    def test_falls_back_when_rm_unavailable(self, tmp_path: Path):
+        from agentbench.cli import _fast_rmtree
+
+        root = tmp_path / "workspace"
+        (root / "sub").mkdir(parents=True)
+        (root / "sub" / "file.txt").write_text("data")
+
+        with patch("agentbench.cli.shutil.which", return_value=None):
+            _fast_rmtree(root)
+
+        assert not root.exists()
+
+    def test_walk_fallback_unlinks_symlinked_dirs_without_following(self, tmp_path: Path):
+        from agentbench.cli import _fast_rmtree
+
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "keep.txt").write_text("keep")
+        root = tmp_path / "workspace"
+        root.mkdir()
+        (root / "link").symlink_to(outside, target_is_directory=True)
+
+        with patch("agentbench.cli.shutil.which", return_value=None):
+            _fast_rmtree(root)
+
+        assert not root.exists()
+        assert (outside / "keep.txt").exists()
+
+    def test_uses_shutil_when_walk_fails(self, tmp_path: Path):
+        from agentbench.cli import _fast_rmtree
+
+        root = tmp_path / "workspace"
+        (root / "sub").mkdir(parents=True)
+
+        with (
+            patch("agentbench.cli.shutil.which", return_value=None),
+            patch("agentbench.cli._walk_rmtree", side_effect=PermissionError("denied")),
+            patch("agentbench.cli.shutil.rmtree") as mock_rmtree,
+        ):
+            _fast_rmtree(root)
+
+        mock_rmtree.assert_called_once_with(root, ignore_errors=True)
@@ -1,10 +1,26 @@
 """Unit tests for logging configuration."""
 
+import io
 import logging
+import sys
+
+import pytest
 
 from agentbench.logging import get_logger, setup_logging
 
 
+@pytest.fixture(autouse=True)
+def _pristine_agentbench_logger():
+    """Run each test against an unconfigured agentbench logger."""
+    logger = logging.getLogger("agentbench")
+    saved = (list(logger.handlers), logger.level, logger.propagate)
+    logger.handlers.clear()
+    yield
+    logger.handlers[:] = saved[0]
+    logger.setLevel(saved[1])
+    logger.propagate = saved[2]
+
+
 class TestSetupLogging:
     """Tests for setup_logging function."""
 
@@ -68,6 +84,29 @@ class TestSetupLogging:
             logger.handlers.pop()
 
 
+    def test_setup_logging_is_idempotent(self):
+        """Repeated calls attach one handler and only update the level."""
+        logger = logging.getLogger("agentbench")
+
+        setup_logging()
+        setup_logging(level=logging.DEBUG)
+
+        ours = [h for h in logger.handlers if h.get_name() == "agentbench"]
+        assert len(ours) == 1
+        assert logger.level == logging.DEBUG
+
+    def test_reconfigure_follows_swapped_stderr(self, monkeypatch: pytest.MonkeyPatch):
+        """Calling setup_logging again rebinds the handler to the current sys.stderr."""
+        setup_logging()
+        captured = io.StringIO()
+        monkeypatch.setattr(sys, "stderr", captured)
+
+        setup_logging()
+        logging.getLogger("agentbench.test").info("hello stderr")
+
+        assert "hello stderr" in captured.getvalue()
+
+
 class TestGetLogger:
     """Tests for get_logger function."""
 
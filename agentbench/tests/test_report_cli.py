@@ -1,8 +1,10 @@
 from pathlib import Path
+from unittest.mock import patch
 
 from typer.testing import CliRunner
 
 from agentbench.cli import app
+from agentbench.reporting.summary import compute_summary
 
 
 def _fixture_run_min() -> Path:
@@ -69,3 +71,38 @@ def test_report_summary_missing_attempts(tmp_path: Path):
     )
     assert result.exit_code != 0
     assert "attempts.jsonl" in result.output
+
+
+def test_write_output_replaces_file_without_leaving_temp(tmp_path: Path):
+    from agentbench.reporting.cli import _write_output
+
+    path = tmp_path / "report_attempts.csv"
+    path.write_text("old", encoding="utf-8")
+
+    _write_output(path, "a,b\r\nü,2\r\n", overwrite=True)
+
+    assert path.read_bytes() == "a,b\r\nü,2\r\n".encode("utf-8")
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_report_summary_approx_percentiles_option(tmp_path: Path):
+    out_dir = tmp_path / "out"
+    with patch("agentbench.reporting.cli.compute_summary", wraps=compute_summary) as spy:
+        result = CliRunner().invoke(
+            app,
+            [
+                "report",
+                "summary",
+                "--run",
+                str(_fixture_run_min()),
+                "--out",
+                str(out_dir),
+                "--format",
+                "md",
+                "--approx-percentiles-above",
+                "1",
+            ],
+        )
+    assert result.exit_code == 0, result.output
+    assert spy.call_args.kwargs["streaming_threshold"] == 1
+    assert (out_dir / "report_summary.md").exists()
@@ -0,0 +1,51 @@
+import json
+from datetime import datetime, timezone
+
+from agentbench.tools.contract import ToolName, ToolRequest, ToolResult, ToolStatus
+
+# Tools that only read the workspace. Anything else (apply_patch, run) may
+# change files, so executing it invalidates every cached read.
+READ_ONLY_TOOLS = frozenset({ToolName.LIST_FILES, ToolName.READ_FILE, ToolName.SEARCH})
+
+
+class ToolResultCache:
+    """Cache successful read-only tool results for a single agent run."""
+
+    def __init__(self) -> None:
+        self._results: dict[tuple[ToolName, str], ToolResult] = {}
+
+    @staticmethod
+    def _key(request: ToolRequest) -> tuple[ToolName, str]:
+        params = json.dumps(request.params, sort_keys=True, default=str)
+        return request.tool, params
+
+    def get(self, request: ToolRequest) -> ToolResult | None:
+        """
+        Return a cached result re-stamped for this request, or None.
+
+        A request for a mutating tool clears the cache and always misses.
+        """
+        if request.tool not in READ_ONLY_TOOLS:
+            self._results.clear()
+            return None
+
+        cached = self._results.get(self._key(request))
+        if cached is None:
+            return None
+
+        now = datetime.now(timezone.utc)
+        return cached.model_copy(
+            update={
+                "request_id": request.request_id,
+                "started_at": now,
+                "ended_at": now,
+                "duration_sec": 0.0,
+            }
+        )
+
+    def put(self, request: ToolRequest, result: ToolResult) -> None:
+        if request.tool in READ_ONLY_TOOLS and result.status == ToolStatus.SUCCESS:
+            self._results[self._key(request)] = result
+
+    def __len__(self) -> int:
+        return len(self._results)
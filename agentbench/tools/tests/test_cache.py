@@ -0,0 +1,73 @@
+"""Unit tests for the per-run read-only tool result cache."""
+
+from datetime import datetime, timezone
+
+from agentbench.tools.cache import ToolResultCache
+from agentbench.tools.contract import ToolName, ToolRequest, ToolResult, ToolStatus
+
+
+def make_request(tool: ToolName, request_id: str, **params) -> ToolRequest:
+    return ToolRequest(tool=tool, params=params, request_id=request_id)
+
+
+def make_result(
+    request: ToolRequest, status: ToolStatus = ToolStatus.SUCCESS
+) -> ToolResult:
+    now = datetime.now(timezone.utc)
+    return ToolResult(
+        request_id=request.request_id,
+        tool=request.tool,
+        status=status,
+        started_at=now,
+        ended_at=now,
+        duration_sec=0.25,
+        data={"content": "print('hi')"},
+    )
+
+
+def test_hit_returns_copy_stamped_with_new_request_id():
+    cache = ToolResultCache()
+    first = make_request(ToolName.READ_FILE, "req-1", path="src/app.py")
+    cache.put(first, make_result(first))
+
+    hit = cache.get(make_request(ToolName.READ_FILE, "req-2", path="src/app.py"))
+
+    assert hit is not None
+    assert hit.request_id == "req-2"
+    assert hit.duration_sec == 0.0
+    assert hit.data == {"content": "print('hi')"}
+
+
+def test_params_order_does_not_matter():
+    cache = ToolResultCache()
+    first = make_request(ToolName.SEARCH, "req-1", query="add", glob="*.py")
+    cache.put(first, make_result(first))
+
+    again = ToolRequest(
+        tool=ToolName.SEARCH,
+        params={"glob": "*.py", "query": "add"},
+        request_id="req-2",
+    )
+
+    assert cache.get(again) is not None
+
+
+def test_mutating_tool_invalidates_cached_reads():
+    cache = ToolResultCache()
+    read = make_request(ToolName.READ_FILE, "req-1", path="src/app.py")
+    cache.put(read, make_result(read))
+
+    assert cache.get(make_request(ToolName.APPLY_PATCH, "req-2", unified_diff="")) is None
+    assert len(cache) == 0
+    assert cache.get(read) is None
+
+
+def test_errors_and_mutating_results_are_not_cached():
+    cache = ToolResultCache()
+    read = make_request(ToolName.READ_FILE, "req-1", path="missing.py")
+    run = make_request(ToolName.RUN, "req-2", command="pytest")
+
+    cache.put(read, make_result(read, status=ToolStatus.ERROR))
+    cache.put(run, make_result(run))
+
+    assert len(cache) == 0
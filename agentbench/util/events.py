@@ -1,10 +1,11 @@
-import json
 import logging
 import os
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from pydantic import BaseModel
+
 from agentbench.schemas.events import Event, EventType
 from agentbench.util.jsonl import append_jsonl
 from agentbench.tools.contract import ToolRequest, ToolResult
@@ -109,11 +110,14 @@ class EventLogger:
     def log_llm_messages(
         self,
         request: dict[str, Any],
-        response: dict[str, Any] | None = None,
+        response: dict[str, Any] | BaseModel | None = None,
         error: dict[str, Any] | None = None,
     ) -> None:
         if not self._log_llm_messages:
             return
+        # Models are dumped only here, so disabled logging costs nothing.
+        if isinstance(response, BaseModel):
+            response = response.model_dump(mode="json")
         path = self.llm_messages_file or (self.events_file.parent / "llm_messages.jsonl")
         payload = {
             "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -131,7 +135,7 @@ class EventLogger:
             return
         path = self.llm_messages_file or (self.events_file.parent / "llm_messages.jsonl")
         error_payload = (
-            json.loads(result.error.model_dump_json()) if result.error else None
+            result.error.model_dump(mode="json") if result.error else None
         )
         payload = {
             "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -170,7 +174,7 @@ class EventLogger:
             "duration_sec": result.duration_sec,
         }
         if result.error:
-            payload["error"] = json.loads(result.error.model_dump_json())
+            payload["error"] = result.error.model_dump(mode="json")
         self.log(event_type=EventType.TOOL_CALL_FINISHED, payload=payload)
         self._log_llm_tool_result(result)
 
@@ -323,7 +327,7 @@ class NullEventLogger:
     def log_llm_request_started(self, model: str, message_count: int, has_tools: bool) -> None: pass
     def log_llm_request_finished(self, request_id: str, status: str, latency_ms: int, tokens_used: int, has_tool_calls: bool) -> None: pass
     def log_llm_request_failed(self, error_type: str, message: str, retryable: bool) -> None: pass
-    def log_llm_messages(self, request: dict[str, Any], response: dict[str, Any] | None = None, error: dict[str, Any] | None = None) -> None: pass
+    def log_llm_messages(self, request: dict[str, Any], response: dict[str, Any] | BaseModel | None = None, error: dict[str, Any] | None = None) -> None: pass
 
 
 NULL_EVENT_LOGGER = NullEventLogger()
@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Any
 
 from filelock import FileLock
+from pydantic_core import to_json
 
 logger = logging.getLogger(__name__)
 
@@ -16,7 +17,7 @@ def append_jsonl(path: Path, record: dict[str, Any] | str) -> bool:
     Append a record to a JSONL file (dict or JSON string).
 
     - Open file in append mode
-    - Write JSON + newline
+    - Write JSON + newline (dicts are serialized straight to UTF-8 bytes)
     - Use file locking for concurrent writes
 
     Returns:
@@ -29,13 +30,16 @@ def append_jsonl(path: Path, record: dict[str, Any] | str) -> bool:
 
         lock = FileLock(str(path) + ".lock")
 
+        if isinstance(record, str):
+            json_line = record.encode("utf-8")
+        else:
+            json_line = to_json(record)
+        if not json_line.endswith(b"\n"):
+            json_line += b"\n"
+
         with lock:
-            if isinstance(record, str):
-                json_line = record if record.endswith("\n") else record + "\n"
-            else:
-                json_line = json.dumps(record) + "\n"
             with open(path, "ab") as f:
-                f.write(json_line.encode("utf-8"))
+                f.write(json_line)
                 f.flush()
                 os.fsync(f.fileno())
 
@@ -48,6 +48,27 @@ def test_log_llm_messages_forced_enabled(tmp_path, monkeypatch):
     assert len(records) == 1
 
 
+def test_log_llm_messages_dumps_model_responses(tmp_path):
+    from agentbench.llm.messages import LLMResponse
+
+    llm_path = tmp_path / "llm_messages.jsonl"
+    logger = EventLogger(
+        run_id="01TEST",
+        events_file=tmp_path / "events.jsonl",
+        llm_messages_file=llm_path,
+        log_llm_messages=True,
+    )
+
+    logger.log_llm_messages(
+        request={"input": "hello"},
+        response=LLMResponse(id="resp_1", output=[{"type": "message", "content": "world"}]),
+    )
+
+    (record,) = read_jsonl(llm_path)
+    assert record["response"]["id"] == "resp_1"
+    assert record["response"]["output"][0]["content"] == "world"
+
+
 def test_log_llm_messages_forced_disabled(tmp_path, monkeypatch):
     monkeypatch.setenv("AGENTBENCH_LOG_LLM_MESSAGES", "1")
 
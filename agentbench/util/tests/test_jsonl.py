@@ -24,3 +24,15 @@ def test_read_jsonl_skips_empty_and_invalid_lines(tmp_path: Path) -> None:
     records = list(read_jsonl(path))
 
     assert records == [{"a": 1}, {"b": 2}]
+
+
+def test_append_jsonl_writes_utf8_and_single_newline(tmp_path: Path) -> None:
+    path = tmp_path / "unicode.jsonl"
+
+    assert append_jsonl(path, {"text": "naïve ✓"}) is True
+    assert append_jsonl(path, '{"text":"done"}\n') is True
+
+    raw = path.read_bytes()
+    assert raw.count(b"\n") == 2
+    assert "naïve ✓".encode("utf-8") in raw
+    assert list(read_jsonl(path)) == [{"text": "naïve ✓"}, {"text": "done"}]